@@ -1,6 +1,7 @@
-import pygame
 from pygame.sprite import Sprite
 
+from image_cache import load_image
+
 class Alien(Sprite):
     """A class to represent a single alien in the fleet."""
 
@@ -10,8 +11,8 @@ class Alien(Sprite):
         self.screen = screen
         self.ai_settings = ai_settings
 
-        # Load the alien image, and set its rect attribute.
-        self.image = pygame.image.load('images/alien.bmp')
+        # Load the shared alien image, and set its rect attribute.
+        self.image = load_image('images/alien.bmp')
         self.rect = self.image.get_rect()
 
         # Start each new alien near the top left of the screen.
@@ -5,6 +5,7 @@ from settings import Settings
 from game_stats import GameStats
 from ship import Ship
 import game_functions as gf
+import image_cache
 
 def run_game():
     # Initialize pygame, settings, and screen object.
@@ -13,6 +14,9 @@ def run_game():
     screen = pygame.display.set_mode(
         (ai_settings.screen_width, ai_settings.screen_height))
     pygame.display.set_caption("Alien Invasion")
+
+    # Load the game's images once, so new levels don't read any files.
+    image_cache.preload(['images/alien.bmp', 'images/ship.bmp'])
     
     # Create an instance to store game statistics.
     stats = GameStats(ai_settings)
@@ -0,0 +1,41 @@
+from time import perf_counter
+
+import pygame
+
+# Every image loaded so far, keyed by path and shared by all sprites.
+images = {}
+
+# Paths whose cached surface has been converted to the display format.
+converted_paths = set()
+
+# How often the cache was used, and how much time went to reading files.
+cache_stats = {'disk_loads': 0, 'hits': 0, 'load_time': 0.0}
+
+def load_image(path):
+    """Return the image at path, only reading the file the first time."""
+    if path in images:
+        cache_stats['hits'] += 1
+    else:
+        start = perf_counter()
+        images[path] = pygame.image.load(path)
+        cache_stats['load_time'] += perf_counter() - start
+        cache_stats['disk_loads'] += 1
+
+    # convert() needs a display, so images loaded earlier are converted
+    #   the first time they're used after the screen has been made.
+    if path not in converted_paths and pygame.display.get_surface():
+        images[path] = images[path].convert()
+        converted_paths.add(path)
+
+    return images[path]
+
+def preload(paths):
+    """Load a list of images up front, so nothing is read during play."""
+    for path in paths:
+        load_image(path)
+
+def clear_cache():
+    """Forget all cached images and reset the statistics."""
+    images.clear()
+    converted_paths.clear()
+    cache_stats.update({'disk_loads': 0, 'hits': 0, 'load_time': 0.0})
@@ -1,4 +1,4 @@
-import pygame
+from image_cache import load_image
 
 class Ship():
 
@@ -7,8 +7,8 @@ class Ship():
         self.screen = screen
         self.ai_settings = ai_settings
 
-        # Load the ship image, and get its rect.
-        self.image = pygame.image.load('images/ship.bmp')
+        # Load the shared ship image, and get its rect.
+        self.image = load_image('images/ship.bmp')
         self.rect = self.image.get_rect()
         self.screen_rect = screen.get_rect()
 
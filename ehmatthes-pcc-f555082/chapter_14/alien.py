@@ -1,6 +1,7 @@
-import pygame
 from pygame.sprite import Sprite
 
+from image_cache import load_image
+
 class Alien(Sprite):
     """A class to represent a single alien in the fleet."""
 
@@ -10,16 +11,18 @@ class Alien(Sprite):
         self.screen = screen
         self.ai_settings = ai_settings
 
-        # Load the alien image, and set its rect attribute.
-        self.image = pygame.image.load('images/alien.bmp')
+        # Load the shared alien image, and set its rect attribute.
+        self.image = load_image('images/alien.bmp')
         self.rect = self.image.get_rect()
 
         # Start each new alien near the top left of the screen.
         self.rect.x = self.rect.width
         self.rect.y = self.rect.height
 
-        # Store the alien's exact position.
+        # Store the alien's exact position, and where it was before the
+        #   last step.
         self.x = float(self.rect.x)
+        self.previous_x = self.x
         
     def check_edges(self):
         """Return True if alien is at edge of screen."""
@@ -29,12 +32,17 @@ class Alien(Sprite):
         elif self.rect.left <= 0:
             return True
         
-    def update(self):
+    def update(self, dt):
         """Move the alien right or left."""
+        self.previous_x = self.x
         self.x += (self.ai_settings.alien_speed_factor *
-                        self.ai_settings.fleet_direction)
+                        self.ai_settings.fleet_direction * dt)
         self.rect.x = self.x
 
+    def interpolate(self, alpha):
+        """Place the rect between the last two positions, for drawing."""
+        self.rect.x = self.previous_x + (self.x - self.previous_x) * alpha
+
     def blitme(self):
         """Draw the alien at its current location."""
         self.screen.blit(self.image, self.rect)
@@ -1,20 +1,32 @@
+import random
+
 import pygame
-from pygame.sprite import Group
 
 from settings import Settings
-from game_stats import GameStats
+from game_stats import GameStats, ACTIVE
 from scoreboard import Scoreboard
 from button import Button
 from ship import Ship
+from fleet import Fleet
+from bullet_pool import BulletPool
+from dirty_renderer import DirtyRenderer
+from game_clock import GameClock
+from replay import InputRecorder
+from profiler import PhaseProfiler, ProfileOverlay
 import game_functions as gf
+import image_cache
 
 def run_game():
     # Initialize pygame, settings, and screen object.
     pygame.init()
     ai_settings = Settings()
+    random.seed(ai_settings.random_seed)
     screen = pygame.display.set_mode(
         (ai_settings.screen_width, ai_settings.screen_height))
     pygame.display.set_caption("Alien Invasion")
+
+    # Load the game's images once, so new levels don't read any files.
+    image_cache.preload(['images/alien.bmp', 'images/ship.bmp'])
     
     # Make the Play button.
     play_button = Button(ai_settings, screen, "Play")
@@ -28,25 +40,83 @@ def run_game():
     
     # Make a ship, a group of bullets, and a group of aliens.
     ship = Ship(ai_settings, screen)
-    bullets = Group()
-    aliens = Group()
+    bullets = BulletPool(ai_settings, screen, ship)
+    aliens = Fleet(ai_settings, screen)
     
     # Create the fleet of aliens.
     gf.create_fleet(ai_settings, screen, ship, aliens)
 
+    # Make a renderer that tracks which parts of the screen change.
+    renderer = DirtyRenderer(ai_settings, screen)
+
+    # Make a clock that steps the game at a fixed rate.
+    clock = GameClock(ai_settings)
+
+    # Time each phase of the loop, and show the timings if asked to.
+    profiler = PhaseProfiler(ai_settings)
+    if ai_settings.profile_overlay:
+        sb.overlay = ProfileOverlay(ai_settings, sb.font, profiler)
+
+    # Record the player's input, if asked to.
+    if ai_settings.record_path:
+        recorder = InputRecorder(ai_settings)
+    else:
+        recorder = None
+
     # Start the main loop for the game.
-    while True:
-        gf.check_events(ai_settings, screen, stats, sb, play_button, ship,
-            aliens, bullets)
-        
-        if stats.game_active:
-            ship.update()
-            gf.update_bullets(ai_settings, screen, stats, sb, ship, aliens,
-                bullets)
-            gf.update_aliens(ai_settings, screen, stats, sb, ship, aliens,
-                bullets)
-        
-        gf.update_screen(ai_settings, screen, stats, sb, ship, aliens,
-            bullets, play_button)
+    try:
+        while True:
+            # Wait for the next frame, and see how many steps are due.
+            steps = clock.tick()
+            bullets.new_frame()
+            if recorder:
+                recorder.start_frame(steps)
+
+            with profiler.phase('events'):
+                gf.check_events(ai_settings, screen, stats, sb,
+                    play_button, ship, aliens, bullets, recorder)
+            
+            for step in range(steps):
+                # Pauses count down in game time, while the loop keeps
+                #   handling events and drawing frames.
+                if gf.update_game_state(ai_settings, screen, stats, sb,
+                        ship, aliens, bullets, clock.dt):
+                    profiler.count_step()
+                    with profiler.phase('ship'):
+                        ship.update(clock.dt)
+                    with profiler.phase('bullets'):
+                        gf.update_bullets(ai_settings, screen, stats, sb,
+                            ship, aliens, bullets, clock.dt)
+                    with profiler.phase('aliens'):
+                        gf.update_aliens(ai_settings, screen, stats, sb,
+                            ship, aliens, bullets, clock.dt)
+            
+            with profiler.phase('draw'):
+                # Draw moving sprites part of the way to their next step,
+                #   unless they've stopped for a pause.
+                interpolate = (ai_settings.interpolate and
+                    stats.state == ACTIVE)
+                if interpolate:
+                    gf.interpolate_sprites(ship, aliens, bullets,
+                        clock.alpha())
+                dirty_rects = gf.draw_screen(ai_settings, screen, stats, sb,
+                    ship, aliens, bullets, play_button, renderer)
+                if interpolate:
+                    gf.interpolate_sprites(ship, aliens, bullets, 1)
+            with profiler.phase('flip'):
+                gf.show_screen(dirty_rects)
+
+            profiler.end_frame(aliens, bullets)
+    finally:
+        # Report how well the frames fit in the frame budget, and how
+        #   many bullets had to be made.
+        print(clock.budget_report())
+        print(bullets.allocation_report())
+        print(profiler.summary())
+        profiler.close()
+
+        if recorder:
+            recorder.save(ai_settings.record_path, stats)
+            print("Session recorded to {}.".format(ai_settings.record_path))
 
 run_game()
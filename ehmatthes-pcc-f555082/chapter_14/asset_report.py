@@ -0,0 +1,68 @@
+import os
+from time import perf_counter
+
+import pygame
+
+from settings import Settings
+from game_stats import GameStats
+from scoreboard import Scoreboard
+from ship import Ship
+from fleet import Fleet
+import game_functions as gf
+import image_cache
+
+def report(label, seconds, disk_loads):
+    """Print one line of the timing report."""
+    print("{:<32} {:>9.3f} ms {:>6} file reads".format(label, seconds * 1000,
+        disk_loads))
+
+def uncached_fleet_time(aliens):
+    """Time a fleet built the old way, reading alien.bmp for every alien."""
+    number_aliens = len(aliens) + 1
+    start = perf_counter()
+    for alien_number in range(number_aliens):
+        pygame.image.load('images/alien.bmp').convert()
+    return perf_counter() - start
+
+# Run without a window, so the report works anywhere.
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# Time startup: making the screen, loading images, and the scoreboard.
+start = perf_counter()
+pygame.init()
+ai_settings = Settings()
+screen = pygame.display.set_mode(
+    (ai_settings.screen_width, ai_settings.screen_height))
+image_cache.preload(['images/alien.bmp', 'images/ship.bmp'])
+stats = GameStats(ai_settings)
+sb = Scoreboard(ai_settings, screen, stats)
+ship = Ship(ai_settings, screen)
+aliens = Fleet(ai_settings, screen)
+report("Startup", perf_counter() - start,
+    image_cache.cache_stats['disk_loads'])
+
+# Time several level transitions, which should never touch the disk.
+for level in range(2, 7):
+    disk_loads = image_cache.cache_stats['disk_loads']
+    start = perf_counter()
+    aliens.empty()
+    ai_settings.increase_speed()
+    gf.create_fleet(ai_settings, screen, ship, aliens)
+    report("Level {} fleet ({} aliens)".format(level, len(aliens)),
+        perf_counter() - start,
+        image_cache.cache_stats['disk_loads'] - disk_loads)
+
+# Time rebuilding the ship icons, as happens when a life is lost.
+disk_loads = image_cache.cache_stats['disk_loads']
+start = perf_counter()
+sb.prep_ships()
+report("Scoreboard ships", perf_counter() - start,
+    image_cache.cache_stats['disk_loads'] - disk_loads)
+
+# Compare with reading the image once per alien, as before the cache.
+report("Uncached fleet (for comparison)",
+    uncached_fleet_time(aliens), len(aliens) + 1)
+
+print("\nCache: {disk_loads} file reads, {hits} hits, ".format(
+    **image_cache.cache_stats) + "{:.3f} ms reading files.".format(
+    image_cache.cache_stats['load_time'] * 1000))
@@ -9,25 +9,39 @@ class Bullet(Sprite):
         super(Bullet, self).__init__()
         self.screen = screen
 
+        self.ai_settings = ai_settings
+
         # Create bullet rect at (0, 0), then set correct position.
         self.rect = pygame.Rect(0, 0, ai_settings.bullet_width,
             ai_settings.bullet_height)
+        self.color = ai_settings.bullet_color
+        self.reset(ship)
+
+    def reset(self, ship):
+        """Move the bullet back to the ship, ready to be fired again."""
         self.rect.centerx = ship.rect.centerx
         self.rect.top = ship.rect.top
         
-        # Store a decimal value for the bullet's position.
+        # Store a decimal value for the bullet's position, and where it
+        #   was before the last step.
         self.y = float(self.rect.y)
+        self.previous_y = self.y
 
-        self.color = ai_settings.bullet_color
-        self.speed_factor = ai_settings.bullet_speed_factor
+        # The bullet speed goes up with each level.
+        self.speed_factor = self.ai_settings.bullet_speed_factor
 
-    def update(self):
+    def update(self, dt):
         """Move the bullet up the screen."""
         # Update the decimal position of the bullet.
-        self.y -= self.speed_factor
+        self.previous_y = self.y
+        self.y -= self.speed_factor * dt
         # Update the rect position.
         self.rect.y = self.y
 
+    def interpolate(self, alpha):
+        """Place the rect between the last two positions, for drawing."""
+        self.rect.y = self.previous_y + (self.y - self.previous_y) * alpha
+
     def draw_bullet(self):
         """Draw the bullet to the screen."""
         pygame.draw.rect(self.screen, self.color, self.rect)
@@ -0,0 +1,85 @@
+from pygame.sprite import Group
+
+from bullet import Bullet
+
+class BulletPool(Group):
+    """
+    A group of bullets that reuses the same Bullet objects, instead of
+      making a new one for every shot.
+    """
+
+    def __init__(self, ai_settings, screen, ship=None):
+        """
+        Make enough bullets up front for the most that can be in flight.
+          Without a ship, bullets are only made as they're fired.
+        """
+        super(BulletPool, self).__init__()
+        self.ai_settings = ai_settings
+        self.screen = screen
+
+        # Every bullet the pool owns, in flight or not, and the ones that
+        #   are ready to be fired.
+        self.slots = []
+        self.free = []
+
+        # How many bullets have been made, in total and this frame.
+        self.allocations = 0
+        self.frame_allocations = 0
+        self.frames = 0
+        self.frames_with_allocations = 0
+        self.shots = 0
+
+        if ship:
+            for bullet_number in range(ai_settings.bullets_allowed):
+                self.allocate(ship)
+        self.frame_allocations = 0
+
+    def allocate(self, ship):
+        """Make a new bullet, and put it in the pool."""
+        bullet = Bullet(self.ai_settings, self.screen, ship)
+        self.slots.append(bullet)
+        self.free.append(bullet)
+        self.allocations += 1
+        self.frame_allocations += 1
+
+    def fire(self, ship):
+        """Fire a bullet from the ship, reusing one if there's one free."""
+        # The pool only grows if bullets_allowed has been raised.
+        if not self.free:
+            self.allocate(ship)
+        bullet = self.free.pop()
+        bullet.reset(ship)
+        self.add(bullet)
+        self.shots += 1
+
+    def remove_internal(self, sprite):
+        """Take a bullet out of flight, and make it ready to fire again."""
+        super(BulletPool, self).remove_internal(sprite)
+        self.free.append(sprite)
+
+    def copy(self):
+        """
+        Return a plain group of the bullets in flight. It isn't a pool,
+          since a pool must never recycle bullets it doesn't own.
+        """
+        return Group(self.sprites())
+
+    def cull(self):
+        """Remove bullets that have left the screen, without copying."""
+        # Walk the pool's own list, so bullets can leave the group safely.
+        for bullet in self.slots:
+            if bullet.rect.bottom <= 0 and self.has_internal(bullet):
+                self.remove(bullet)
+
+    def new_frame(self):
+        """Start counting the bullets made in a new frame."""
+        if self.frame_allocations:
+            self.frames_with_allocations += 1
+        self.frame_allocations = 0
+        self.frames += 1
+
+    def allocation_report(self):
+        """Return a short summary of how many bullets had to be made."""
+        return ("{} shots fired from {} bullets, {} of {} frames made new "
+            "bullets.".format(self.shots, self.allocations,
+            self.frames_with_allocations, self.frames))
@@ -31,3 +31,7 @@ class Button():
         # Draw blank button, then draw message.
         self.screen.fill(self.button_color, self.rect)
         self.screen.blit(self.msg_image, self.msg_image_rect)
+
+    def regions(self):
+        """Return the (rect, image) pairs that draw_button() draws."""
+        return [(self.rect, self.msg_image)]
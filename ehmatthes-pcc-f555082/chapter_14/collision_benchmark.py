@@ -0,0 +1,68 @@
+from random import randint, seed
+from timeit import timeit
+
+import pygame
+from pygame.sprite import Group, Sprite
+
+from settings import Settings
+from fleet import Fleet
+import spatial_hash
+
+def make_sprite(x, y, width, height):
+    """Return a bare sprite with a rect at the given position."""
+    sprite = Sprite()
+    sprite.rect = pygame.Rect(x, y, width, height)
+    return sprite
+
+def make_fleet(group, number_aliens):
+    """Fill group with a grid of alien-sized sprites, like create_fleet."""
+    columns = int(number_aliens ** 0.5) + 1
+    for alien_number in range(number_aliens):
+        row, column = divmod(alien_number, columns)
+        group.add(make_sprite(60 + 120 * column, 58 + 116 * row, 60, 58))
+
+def make_bullets(number_bullets, width, height):
+    """Return a list of bullet-sized sprites scattered over the fleet."""
+    return [make_sprite(randint(0, width), randint(0, height), 3, 15)
+        for bullet_number in range(number_bullets)]
+
+def time_groupcollide(number_aliens, number_bullets, repeats):
+    """Time one frame of collision checks, with and without the grid."""
+    seed(number_aliens)
+    plain_aliens = Group()
+    make_fleet(plain_aliens, number_aliens)
+    hashed_aliens = Fleet(Settings(), pygame.Surface((1, 1)),
+        *plain_aliens.sprites())
+
+    width = max(sprite.rect.right for sprite in plain_aliens)
+    height = max(sprite.rect.bottom for sprite in plain_aliens)
+    bullets = Group(make_bullets(number_bullets, width, height))
+
+    # Both paths must find exactly the same collisions.
+    expected = pygame.sprite.groupcollide(bullets, plain_aliens, False,
+        False)
+    found = spatial_hash.groupcollide(bullets, hashed_aliens, False, False)
+    assert found == expected
+
+    def plain_frame():
+        pygame.sprite.groupcollide(bullets, plain_aliens, False, False)
+
+    # Aliens move every frame, so each hashed frame works out the pixel
+    #   bounds again. The grid moves with the fleet, and isn't rebuilt.
+    def hashed_frame():
+        hashed_aliens.moved()
+        spatial_hash.groupcollide(bullets, hashed_aliens, False, False)
+
+    plain_time = timeit(plain_frame, number=repeats) / repeats
+    hashed_time = timeit(hashed_frame, number=repeats) / repeats
+    return plain_time, hashed_time
+
+print("aliens  bullets  groupcollide (ms)  spatial hash (ms)  speedup")
+for number_aliens in [50, 200, 1000, 5000, 20000]:
+    number_bullets = max(3, number_aliens // 10)
+    repeats = max(3, 20000 // number_aliens)
+    plain_time, hashed_time = time_groupcollide(number_aliens,
+        number_bullets, repeats)
+    print("{:>6}  {:>7}  {:>17.3f}  {:>17.3f}  {:>6.1f}x".format(
+        number_aliens, number_bullets, plain_time * 1000,
+        hashed_time * 1000, plain_time / hashed_time))
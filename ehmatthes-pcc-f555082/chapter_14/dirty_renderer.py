@@ -0,0 +1,85 @@
+import pygame
+
+import game_functions as gf
+
+class DirtyRenderer():
+    """Redraw the screen, but only send the changed regions to the display."""
+
+    def __init__(self, ai_settings, screen):
+        """Initialize the renderer, and remember nothing about past frames."""
+        self.ai_settings = ai_settings
+        self.screen = screen
+
+        # What each part of the screen looked like when last drawn.
+        self.last_regions = {}
+
+        # The first frame has to fill and show the whole screen.
+        self.full_update = True
+
+    def reset(self):
+        """Forget past frames; the whole screen will be redrawn next time."""
+        self.last_regions = {}
+        self.full_update = True
+
+    def changed_rects(self, name, regions):
+        """
+        Compare one part of the screen with the last frame, and return
+          the rects that need to be updated: where it was, and where it is.
+        """
+        # Copy the rects, because sprites move them in place.
+        regions = [(tuple(rect), content) for rect, content in regions]
+        old_regions = self.last_regions.get(name, [])
+        self.last_regions[name] = regions
+        if regions == old_regions:
+            return [], []
+
+        old_rects = [pygame.Rect(rect) for rect, content in old_regions]
+        new_rects = [pygame.Rect(rect) for rect, content in regions]
+        return old_rects, new_rects
+
+    def update_screen(self, stats, sb, ship, aliens, bullets, play_button):
+        """Redraw the screen, and update only the regions that changed."""
+        gf.show_screen(self.draw_screen(stats, sb, ship, aliens, bullets,
+            play_button))
+
+    def draw_screen(self, stats, sb, ship, aliens, bullets, play_button):
+        """
+        Redraw the screen, and return the rects that changed, or None if
+          the whole screen has to be shown.
+        """
+        # Each group reports the regions it drew to, and what it drew there.
+        parts = {
+            'bullets': [(bullet.rect, bullet.color)
+                for bullet in bullets.sprites()],
+            'ship': [(ship.rect, ship.image)],
+            'aliens': aliens.regions(),
+            'scoreboard': sb.regions(),
+            'play_button': [],
+            }
+        if not stats.game_active:
+            parts['play_button'] = play_button.regions()
+
+        erase_rects, dirty_rects = [], []
+        for name, regions in parts.items():
+            old_rects, new_rects = self.changed_rects(name, regions)
+            erase_rects.extend(old_rects)
+            dirty_rects.extend(old_rects + new_rects)
+
+        if self.full_update:
+            self.screen.fill(self.ai_settings.bg_color)
+        elif not dirty_rects:
+            # Nothing moved, so there's nothing to draw.
+            return []
+        else:
+            # Erase everything at its old position.
+            for rect in erase_rects:
+                self.screen.fill(self.ai_settings.bg_color, rect)
+
+        # Redraw everything, so anything under an erased rect reappears.
+        gf.draw_sprites(self.screen, stats, sb, ship, aliens, bullets,
+            play_button)
+
+        if self.full_update:
+            self.full_update = False
+            return None
+        return dirty_rects
@@ -0,0 +1,356 @@
+from math import ceil, floor
+
+import numpy as np
+import pygame
+from pygame.sprite import Group
+
+from spatial_hash import SpatialHash
+
+# Pixels of this color are left out when the fleet layer is drawn. It
+#   doesn't appear in the alien image.
+LAYER_COLORKEY = (255, 0, 255)
+
+def rect_positions(values):
+    """Round positions the way pygame.Rect does, with halves away from 0."""
+    return np.copysign(np.floor(np.abs(values) + 0.5), values)
+
+class Fleet(Group):
+    """
+    A group of aliens whose positions are kept in NumPy arrays, so the
+      whole fleet can be moved and checked with a few array operations.
+    """
+
+    def __init__(self, ai_settings, screen, *sprites):
+        """Initialize the fleet with room for a few aliens."""
+        self.ai_settings = ai_settings
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+
+        # Each alien gets a slot in the arrays; slots are never reused
+        #   until the fleet is emptied.
+        self.slots = {}
+        self.members = []
+        self.count = 0
+        self.allocate(64)
+
+        # The arrays hold the true positions. Rects are only updated from
+        #   them when someone looks at the sprites, and the pixel bounds
+        #   used for checks are only worked out once per move. draw_x is
+        #   where the aliens are drawn, which is between steps after
+        #   interpolate().
+        self.rects_stale = False
+        self.draw_x = self.x
+        self.bounds = None
+        self.extent = None
+
+        # One image of the whole fleet, only rebuilt when an alien joins
+        #   or dies, and where to draw it this frame (None until worked
+        #   out, False if the aliens have to be drawn one at a time).
+        self.layer = None
+        self.layer_rect = None
+
+        # A grid of the aliens' slots for collision checks, placed
+        #   relative to slot 0. Every alien moves by the same amount, so
+        #   the grid only has to be rebuilt when an alien joins.
+        self.grid = None
+
+        super(Fleet, self).__init__(*sprites)
+
+    def allocate(self, capacity):
+        """Make empty arrays with room for capacity aliens."""
+        self.x = np.zeros(capacity)
+        self.previous_x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.width = np.zeros(capacity)
+        self.height = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def grow(self):
+        """Double the size of the arrays, keeping the aliens in them."""
+        old_arrays = [self.x, self.previous_x, self.y, self.width,
+            self.height, self.alive]
+        self.allocate(2 * len(self.x))
+        new_arrays = [self.x, self.previous_x, self.y, self.width,
+            self.height, self.alive]
+        for old_array, new_array in zip(old_arrays, new_arrays):
+            new_array[:len(old_array)] = old_array
+
+    def add_internal(self, sprite, layer=None):
+        """Add an alien, copying its position into the next free slot."""
+        super(Fleet, self).add_internal(sprite, layer)
+        if self.count == len(self.x):
+            self.grow()
+
+        index = self.count
+        self.count += 1
+        self.slots[sprite] = index
+        self.members.append(sprite)
+
+        self.x[index] = getattr(sprite, 'x', sprite.rect.x)
+        self.previous_x[index] = self.x[index]
+        self.y[index] = sprite.rect.y
+        self.width[index], self.height[index] = sprite.rect.size
+        self.alive[index] = True
+        self.layer = None
+        self.grid = None
+        self.moved()
+
+    def remove_internal(self, sprite):
+        """Remove an alien, and mark its slot as dead."""
+        super(Fleet, self).remove_internal(sprite)
+        index = self.slots.pop(sprite)
+        self.alive[index] = False
+        if self.bounds is not None:
+            self.bounds[:, index] = np.nan
+        self.extent = None
+        self.layer = None
+        self.layer_rect = None
+
+        # Once the fleet is gone, start filling slots from the beginning.
+        if not self.slots:
+            self.members = []
+            self.count = 0
+            self.grid = None
+
+    def __len__(self):
+        """Return the number of aliens, without touching their rects."""
+        return len(self.slots)
+
+    def __bool__(self):
+        return bool(self.slots)
+
+    def copy(self):
+        """Return a new fleet of the same aliens, in the same places."""
+        fleet = Fleet(self.ai_settings, self.screen)
+        fleet.add([alien for alien in self.members if alien in self.slots])
+        indices = [self.slots[alien] for alien in fleet.members]
+        fleet.x[:fleet.count] = self.x[indices]
+        fleet.previous_x[:fleet.count] = self.previous_x[indices]
+        fleet.y[:fleet.count] = self.y[indices]
+        fleet.moved()
+        return fleet
+
+    def sprites(self):
+        """Return a list of the aliens, with their rects up to date."""
+        self.sync_rects()
+        return super(Fleet, self).sprites()
+
+    def sync_rects(self):
+        """Copy positions from the arrays to the rects, if they've moved."""
+        if self.rects_stale:
+            self.set_rects(self.draw_x)
+            self.rects_stale = False
+
+    def set_rects(self, x_values):
+        """Place each alien's rect using x_values and the y array."""
+        n = self.count
+        left = rect_positions(x_values[:n]).astype(int).tolist()
+        top = self.y[:n].astype(int).tolist()
+        for sprite, index in self.slots.items():
+            sprite.rect.x = left[index]
+            sprite.rect.y = top[index]
+
+    def get_bounds(self):
+        """
+        Return the left, top, right, and bottom pixel edges of every slot,
+          as the rows of one array. Dead slots are NaN, so they never match.
+        """
+        if self.bounds is None:
+            n = self.count
+            left = rect_positions(self.x[:n])
+            top = self.y[:n]
+            self.bounds = np.array([left, top, left + self.width[:n],
+                top + self.height[:n]])
+            self.bounds[:, ~self.alive[:n]] = np.nan
+        return self.bounds
+
+    def get_extent(self):
+        """
+        Return the left, top, right, and bottom edges of a box around all
+          the living aliens, or None if there aren't any.
+        """
+        if self.extent is None and self.slots:
+            # fmin and fmax skip over the NaNs of dead slots.
+            left, top, right, bottom = self.get_bounds()
+            self.extent = (float(np.fmin.reduce(left)),
+                float(np.fmin.reduce(top)), float(np.fmax.reduce(right)),
+                float(np.fmax.reduce(bottom)))
+        return self.extent
+
+    def moved(self):
+        """Remember that the rects and bounds no longer match the arrays."""
+        self.rects_stale = True
+        self.draw_x = self.x
+        self.bounds = None
+        self.extent = None
+        self.layer_rect = None
+
+    def update(self, dt):
+        """Move every alien right or left in one step."""
+        n = self.count
+        self.previous_x[:n] = self.x[:n]
+        self.x[:n] += (self.ai_settings.alien_speed_factor *
+                        self.ai_settings.fleet_direction * dt)
+        self.moved()
+
+    def interpolate(self, alpha):
+        """Draw the aliens between their last two positions."""
+        n = self.count
+        self.draw_x = (self.previous_x[:n] +
+            (self.x[:n] - self.previous_x[:n]) * alpha)
+        self.rects_stale = True
+        self.layer_rect = None
+
+    def check_edges(self):
+        """Return True if any alien is at an edge of the screen."""
+        extent = self.get_extent()
+        return bool(extent and (extent[2] >= self.screen_rect.right or
+            extent[0] <= 0))
+
+    def drop(self, distance):
+        """Move the whole fleet down."""
+        self.y[:self.count] += distance
+        self.moved()
+
+    def check_bottom(self):
+        """Return True if any alien has reached the bottom of the screen."""
+        extent = self.get_extent()
+        return bool(extent and extent[3] >= self.screen_rect.bottom)
+
+    def get_layer_rect(self):
+        """
+        Return the rect to draw the fleet layer at this frame, or None if
+          the aliens have to be drawn one at a time.
+        """
+        if self.layer_rect is None:
+            self.layer_rect = self.place_layer() or False
+        return self.layer_rect or None
+
+    def place_layer(self):
+        """Work out where the fleet layer goes, compositing it if needed."""
+        x_values = self.draw_x
+        if self.layer is None:
+            self.composite_layer(x_values)
+        if not self.layer:
+            return None
+
+        # Each alien's position is rounded to whole pixels on its own, so
+        #   now and then one lands a pixel away from where it is in the
+        #   layer. Those frames are drawn one alien at a time.
+        left = rect_positions(x_values[self.layer_indices])
+        if not np.array_equal(left - left[0], self.layer_lefts):
+            return None
+
+        rect = self.layer.get_rect()
+        rect.topleft = (int(left[0]) + self.layer_offset[0],
+            int(self.y[self.layer_indices[0]]) + self.layer_offset[1])
+        return rect
+
+    def composite_layer(self, x_values):
+        """Draw every living alien onto one image, in its place."""
+        indices = np.flatnonzero(self.alive[:self.count])
+        if not len(indices):
+            self.layer = False
+            return
+
+        left = rect_positions(x_values[indices]).astype(int)
+        top = self.y[indices].astype(int)
+        layer_left, layer_top = int(left.min()), int(top.min())
+        layer_width = int((left + self.width[indices]).max()) - layer_left
+        layer_height = int((top + self.height[indices]).max()) - layer_top
+
+        layer = pygame.Surface((layer_width, layer_height))
+        if pygame.display.get_surface():
+            layer = layer.convert()
+        layer.fill(LAYER_COLORKEY)
+        layer.blits([(self.members[index].image,
+                (alien_left - layer_left, alien_top - layer_top))
+            for index, alien_left, alien_top in zip(indices.tolist(),
+                left.tolist(), top.tolist())], False)
+        layer.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+
+        # Remember where each alien is in the layer, relative to the first
+        #   one, and where the layer is relative to that alien.
+        self.layer = layer
+        self.layer_indices = indices
+        self.layer_lefts = left - left[0]
+        self.layer_offset = (layer_left - int(left[0]),
+            layer_top - int(top[0]))
+
+    def draw(self, surface, bgsurf=None, special_flags=0):
+        """Draw the fleet with one blit of the fleet layer, if possible."""
+        layer_rect = self.ai_settings.fleet_layer and self.get_layer_rect()
+        if not layer_rect:
+            return super(Fleet, self).draw(surface, bgsurf, special_flags)
+        surface.blit(self.layer, layer_rect, None, special_flags)
+        return []
+
+    def regions(self):
+        """Return the (rect, image) pairs that draw() draws."""
+        layer_rect = self.ai_settings.fleet_layer and self.get_layer_rect()
+        if not layer_rect:
+            return [(alien.rect, alien.image) for alien in self.sprites()]
+        return [(layer_rect, self.layer)]
+
+    def get_grid(self):
+        """
+        Return a SpatialHash of the living aliens' slots, in positions
+          relative to slot 0. Each box is a pixel bigger all round than
+          the alien, for aliens that round to a different pixel than
+          slot 0 does.
+        """
+        if self.grid is None:
+            indices = np.flatnonzero(self.alive[:self.count])
+            left = np.floor(self.x[indices] - self.x[0]).astype(int) - 1
+            top = np.floor(self.y[indices] - self.y[0]).astype(int) - 1
+            width = np.ceil(self.width[indices]).astype(int) + 3
+            height = np.ceil(self.height[indices]).astype(int) + 3
+
+            # The aliens are laid out on a lattice about their own size
+            #   apart, so cells that size hold an alien or two each.
+            self.grid = SpatialHash(int(max(width.max(), height.max())))
+            self.grid.rebuild([(pygame.Rect(box), index)
+                for index, box in zip(indices.tolist(), zip(left.tolist(),
+                    top.tolist(), width.tolist(), height.tolist()))])
+        return self.grid
+
+    def query(self, rect):
+        """Return the aliens that overlap rect, in the order they joined."""
+        return self.query_all([rect])[0]
+
+    def query_all(self, rects):
+        """
+        Return a list of the aliens that overlap each rect. Each rect only
+          looks at the aliens in the grid cells it covers.
+        """
+        hit_lists = [[] for rect in rects]
+
+        # Most rects are nowhere near the fleet, and can be skipped
+        #   without looking at the grid.
+        extent = rects and self.get_extent()
+        if not extent:
+            return hit_lists
+        fleet_left, fleet_top, fleet_right, fleet_bottom = extent
+        near_fleet = [(hits, rect) for hits, rect in zip(hit_lists, rects)
+            if rect.left < fleet_right and rect.right > fleet_left and
+                rect.top < fleet_bottom and rect.bottom > fleet_top]
+        if not near_fleet:
+            return hit_lists
+
+        grid = self.get_grid()
+        left, top, right, bottom = self.get_bounds()
+        origin_x, origin_y = float(self.x[0]), float(self.y[0])
+        for hits, rect in near_fleet:
+            # Find the candidates on the grid, then check each one's pixel
+            #   bounds; dead slots are NaN, and never match.
+            grid_left = floor(rect.left - origin_x)
+            grid_top = floor(rect.top - origin_y)
+            grid_rect = pygame.Rect(grid_left, grid_top,
+                ceil(rect.right - origin_x) - grid_left,
+                ceil(rect.bottom - origin_y) - grid_top)
+            for index in grid.query(grid_rect):
+                if (left[index] < rect.right and right[index] > rect.left
+                        and top[index] < rect.bottom and
+                        bottom[index] > rect.top):
+                    hits.append(self.members[index])
+        return hit_lists
@@ -0,0 +1,76 @@
+import os
+from timeit import timeit
+
+import pygame
+from pygame.sprite import Group
+
+from settings import Settings
+from alien import Alien
+from fleet import Fleet
+import image_cache
+
+def fill_fleet(ai_settings, screen, aliens, number_aliens):
+    """Add a grid of aliens to the group, packed like create_fleet does."""
+    columns = 100
+    for alien_number in range(number_aliens):
+        row, column = divmod(alien_number, columns)
+        alien = Alien(ai_settings, screen)
+        alien.x = 10 + 11 * column
+        alien.rect.x = alien.x
+        alien.rect.y = 10 + 5 * row
+        aliens.add(alien)
+
+def sprite_step(ai_settings, screen, ship, aliens, dt):
+    """One step of the fleet, one alien at a time, as before the arrays."""
+    for alien in aliens.sprites():
+        if alien.check_edges():
+            for alien in aliens.sprites():
+                alien.rect.y += ai_settings.fleet_drop_speed
+            ai_settings.fleet_direction *= -1
+            break
+    aliens.update(dt)
+    pygame.sprite.spritecollideany(ship, aliens)
+    screen_rect = screen.get_rect()
+    for alien in aliens.sprites():
+        if alien.rect.bottom >= screen_rect.bottom:
+            break
+
+def fleet_step(ai_settings, screen, ship, aliens, dt):
+    """One step of the fleet, using whole-array operations."""
+    if aliens.check_edges():
+        aliens.drop(ai_settings.fleet_drop_speed)
+        ai_settings.fleet_direction *= -1
+    aliens.update(dt)
+    aliens.query(ship.rect)
+    aliens.check_bottom()
+
+# Run without a window, so the benchmark works anywhere.
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame.init()
+ai_settings = Settings()
+ai_settings.screen_width = 1200
+screen = pygame.display.set_mode(
+    (ai_settings.screen_width, ai_settings.screen_height))
+image_cache.preload(['images/alien.bmp', 'images/ship.bmp'])
+ship = Alien(ai_settings, screen)
+ship.rect.bottom = screen.get_rect().bottom
+dt = 1 / ai_settings.steps_per_second
+
+print("aliens  per-sprite step (us)  fleet step (us)  speedup")
+for number_aliens in [36, 100, 1000, 5000, 20000]:
+    sprite_aliens = Group()
+    array_aliens = Fleet(ai_settings, screen)
+    fill_fleet(ai_settings, screen, sprite_aliens, number_aliens)
+    fill_fleet(ai_settings, screen, array_aliens, number_aliens)
+
+    # The first step builds the fleet's collision grid, which lasts until
+    #   an alien joins, so leave it out of the time per step.
+    fleet_step(ai_settings, screen, ship, array_aliens, dt)
+
+    repeats = max(20, 200000 // number_aliens)
+    sprite_time = timeit(lambda: sprite_step(ai_settings, screen, ship,
+        sprite_aliens, dt), number=repeats) / repeats
+    fleet_time = timeit(lambda: fleet_step(ai_settings, screen, ship,
+        array_aliens, dt), number=repeats) / repeats
+    print("{:>6}  {:>20.1f}  {:>15.1f}  {:>6.1f}x".format(number_aliens,
+        sprite_time * 1e6, fleet_time * 1e6, sprite_time / fleet_time))
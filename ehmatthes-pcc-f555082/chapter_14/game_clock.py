@@ -0,0 +1,71 @@
+import pygame
+
+class GameClock():
+    """Step the game at a fixed rate, however fast frames are drawn."""
+
+    def __init__(self, ai_settings):
+        """Initialize the clock, and the frame budget statistics."""
+        self.clock = pygame.time.Clock()
+        self.fps_cap = ai_settings.fps_cap
+        self.max_frame_time = ai_settings.max_frame_time
+
+        # Every step of the simulation covers the same amount of time.
+        self.dt = 1 / ai_settings.steps_per_second
+
+        # Time that has passed, but hasn't been simulated yet.
+        self.accumulator = 0.0
+
+        # Each frame's work should fit in the time between capped frames.
+        if self.fps_cap:
+            self.frame_budget = 1 / self.fps_cap
+        else:
+            self.frame_budget = None
+        self.frames = 0
+        self.frames_over_budget = 0
+        self.total_frame_time = 0.0
+        self.total_work_time = 0.0
+        self.worst_work_time = 0.0
+
+    def tick(self):
+        """
+        Wait until the next frame is due, then return how many fixed steps
+          to run to catch up with the time that has passed.
+        """
+        frame_time = self.clock.tick(self.fps_cap) / 1000
+        self.total_frame_time += frame_time
+        self.record_work_time(self.clock.get_rawtime() / 1000)
+
+        # After a very slow frame, drop time instead of running a burst of
+        #   steps that would make the next frame slow as well.
+        self.accumulator += min(frame_time, self.max_frame_time)
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        return steps
+
+    def alpha(self):
+        """Return how far we are between the last step and the next one."""
+        return self.accumulator / self.dt
+
+    def record_work_time(self, work_time):
+        """Track how much of the frame budget the last frame used."""
+        self.frames += 1
+        self.total_work_time += work_time
+        self.worst_work_time = max(self.worst_work_time, work_time)
+        if self.frame_budget and work_time > self.frame_budget:
+            self.frames_over_budget += 1
+
+    def budget_report(self):
+        """Return a short summary of frame rate and frame budget use."""
+        if not self.frames:
+            return "No frames drawn."
+        average_work = self.total_work_time / self.frames
+        fps = self.frames / max(self.total_frame_time, 0.001)
+        report = "{} frames at {:.1f} fps, average work {:.2f} ms".format(
+            self.frames, fps, average_work * 1000)
+        report += ", worst {:.2f} ms".format(self.worst_work_time * 1000)
+        if self.frame_budget:
+            report += ", {:.0%} of a {:.2f} ms budget".format(
+                average_work / self.frame_budget, self.frame_budget * 1000)
+            report += ", {} frames over budget".format(
+                self.frames_over_budget)
+        return report + "."
@@ -1,19 +1,21 @@
 import sys
-from time import sleep
 
 import pygame
 
-from bullet import Bullet
 from alien import Alien
+from game_stats import ACTIVE, RESPAWNING, LEVEL_TRANSITION, GAME_OVER
+import spatial_hash
 
-def check_keydown_events(event, ai_settings, screen, ship, bullets):
+def check_keydown_events(event, ai_settings, screen, stats, ship, bullets):
     """Respond to keypresses."""
     if event.key == pygame.K_RIGHT:
         ship.moving_right = True
     elif event.key == pygame.K_LEFT:
         ship.moving_left = True
     elif event.key == pygame.K_SPACE:
-        fire_bullet(ai_settings, screen, ship, bullets)
+        # Bullets fired during a pause would be waiting for the next fleet.
+        if stats.state == ACTIVE:
+            fire_bullet(ai_settings, screen, ship, bullets)
     elif event.key == pygame.K_q:
         sys.exit()
         
@@ -25,17 +27,28 @@ def check_keyup_events(event, ship):
         ship.moving_left = False
 
 def check_events(ai_settings, screen, stats, sb, play_button, ship, aliens,
-        bullets):
-    """Respond to keypresses and mouse events."""
-    for event in pygame.event.get():
+        bullets, event_source=None):
+    """
+    Respond to keypresses and mouse events. Events come from pygame,
+      unless an event_source such as a recorder or a replay is given.
+    """
+    if event_source:
+        events = event_source.get()
+    else:
+        events = pygame.event.get()
+
+    for event in events:
         if event.type == pygame.QUIT:
             sys.exit()
         elif event.type == pygame.KEYDOWN:
-            check_keydown_events(event, ai_settings, screen, ship, bullets)
+            check_keydown_events(event, ai_settings, screen, stats, ship,
+                bullets)
         elif event.type == pygame.KEYUP:
             check_keyup_events(event, ship)
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            # Use the position saved in the event, so replays click in the
+            #   same place.
+            mouse_x, mouse_y = event.pos
             check_play_button(ai_settings, screen, stats, sb, play_button,
                 ship, aliens, bullets, mouse_x, mouse_y)
             
@@ -44,43 +57,110 @@ def check_play_button(ai_settings, screen, stats, sb, play_button, ship,
     """Start a new game when the player clicks Play."""
     button_clicked = play_button.rect.collidepoint(mouse_x, mouse_y)
     if button_clicked and not stats.game_active:
-        # Reset the game settings.
-        ai_settings.initialize_dynamic_settings()
-        
         # Hide the mouse cursor.
         pygame.mouse.set_visible(False)
         
-        # Reset the game statistics.
-        stats.reset_stats()
-        stats.game_active = True
-        
-        # Reset the scoreboard images.
-        sb.prep_score()
-        sb.prep_high_score()
-        sb.prep_level()
-        sb.prep_ships()
-        
-        # Empty the list of aliens and bullets.
-        aliens.empty()
-        bullets.empty()
+        start_game(ai_settings, screen, stats, sb, ship, aliens, bullets)
+
+def start_game(ai_settings, screen, stats, sb, ship, aliens, bullets):
+    """Reset the settings, statistics, and sprites for a new game."""
+    # Reset the game settings.
+    ai_settings.initialize_dynamic_settings()
+    
+    # Reset the game statistics.
+    stats.reset_stats()
+    stats.set_state(ACTIVE)
         
-        # Create a new fleet and center the ship.
+    # Reset the scoreboard images.
+    sb.prep_score()
+    sb.prep_high_score()
+    sb.prep_level()
+    sb.prep_ships()
+    
+    reset_fleet(ai_settings, screen, ship, aliens, bullets)
+
+def reset_fleet(ai_settings, screen, ship, aliens, bullets):
+    """Replace the fleet with a new one, and center the ship."""
+    # Empty the list of aliens and bullets.
+    aliens.empty()
+    bullets.empty()
+    
+    # Create a new fleet and center the ship.
+    create_fleet(ai_settings, screen, ship, aliens)
+    ship.center_ship()
+
+def update_game_state(ai_settings, screen, stats, sb, ship, aliens, bullets,
+        dt):
+    """
+    Count down any pause by one step of dt seconds. Return True if the
+      game is active, and the sprites should move this step.
+    """
+    if stats.state in (RESPAWNING, LEVEL_TRANSITION):
+        stats.pause_left -= dt
+        if stats.pause_left <= 0:
+            end_pause(ai_settings, screen, stats, sb, ship, aliens, bullets)
+    return stats.state == ACTIVE
+
+def start_pause(ai_settings, screen, stats, sb, ship, aliens, bullets, state,
+        pause):
+    """
+    Hold the game still in state for pause seconds. The loop keeps
+      handling events and drawing frames, but nothing moves.
+    """
+    stats.set_state(state, pause)
+    if pause <= 0:
+        # Nothing to wait for, as in headless games.
+        end_pause(ai_settings, screen, stats, sb, ship, aliens, bullets)
+
+def end_pause(ai_settings, screen, stats, sb, ship, aliens, bullets):
+    """Finish whatever the pause was waiting to do, and resume the game."""
+    if stats.state == RESPAWNING:
+        reset_fleet(ai_settings, screen, ship, aliens, bullets)
+    elif stats.state == LEVEL_TRANSITION:
         create_fleet(ai_settings, screen, ship, aliens)
-        ship.center_ship()
+    stats.set_state(ACTIVE)
 
 def fire_bullet(ai_settings, screen, ship, bullets):
     """Fire a bullet, if limit not reached yet."""
-    # Create a new bullet, add to bullets group.
+    # Take a bullet from the pool, and add it to the bullets in flight.
     if len(bullets) < ai_settings.bullets_allowed:
-        new_bullet = Bullet(ai_settings, screen, ship)
-        bullets.add(new_bullet)
+        bullets.fire(ship)
 
 def update_screen(ai_settings, screen, stats, sb, ship, aliens, bullets,
-        play_button):
+        play_button, renderer):
     """Update images on the screen, and flip to the new screen."""
+    dirty_rects = draw_screen(ai_settings, screen, stats, sb, ship, aliens,
+        bullets, play_button, renderer)
+    show_screen(dirty_rects)
+
+def draw_screen(ai_settings, screen, stats, sb, ship, aliens, bullets,
+        play_button, renderer):
+    """
+    Draw the next frame, without showing it yet. Return the rects that
+      changed, or None if the whole screen has to be shown.
+    """
+    if ai_settings.dirty_rect_rendering:
+        # Only the parts of the screen that changed need to be shown.
+        return renderer.draw_screen(stats, sb, ship, aliens, bullets,
+            play_button)
+
     # Redraw the screen, each pass through the loop.
     screen.fill(ai_settings.bg_color)
-    
+    draw_sprites(screen, stats, sb, ship, aliens, bullets, play_button)
+
+    # The renderer can't trust its record of the last frame anymore.
+    renderer.reset()
+    return None
+
+def show_screen(dirty_rects):
+    """Make the most recently drawn screen visible."""
+    if dirty_rects is None:
+        pygame.display.flip()
+    elif dirty_rects:
+        pygame.display.update(dirty_rects)
+
+def draw_sprites(screen, stats, sb, ship, aliens, bullets, play_button):
+    """Draw the bullets, ship, aliens, score, and Play button."""
     # Redraw all bullets, behind ship and aliens.
     for bullet in bullets.sprites():
         bullet.draw_bullet()
@@ -93,19 +173,25 @@ def update_screen(ai_settings, screen, stats, sb, ship, aliens, bullets,
     # Draw the play button if the game is inactive.
     if not stats.game_active:
         play_button.draw_button()
-
-    # Make the most recently drawn screen visible.
-    pygame.display.flip()
     
-def update_bullets(ai_settings, screen, stats, sb, ship, aliens, bullets):
+def interpolate_sprites(ship, aliens, bullets, alpha):
+    """
+    Place the moving sprites between their last two positions, for
+      drawing. An alpha of 1 puts them back where the last step left them.
+    """
+    ship.interpolate(alpha)
+    aliens.interpolate(alpha)
+    for bullet in bullets.sprites():
+        bullet.interpolate(alpha)
+    
+def update_bullets(ai_settings, screen, stats, sb, ship, aliens, bullets,
+        dt):
     """Update position of bullets, and get rid of old bullets."""
     # Update bullet positions.
-    bullets.update()
+    bullets.update(dt)
 
     # Get rid of bullets that have disappeared.
-    for bullet in bullets.copy():
-        if bullet.rect.bottom <= 0:
-            bullets.remove(bullet)
+    bullets.cull()
             
     check_bullet_alien_collisions(ai_settings, screen, stats, sb, ship,
         aliens, bullets)
@@ -120,7 +206,7 @@ def check_bullet_alien_collisions(ai_settings, screen, stats, sb, ship,
         aliens, bullets):
     """Respond to bullet-alien collisions."""
     # Remove any bullets and aliens that have collided.
-    collisions = pygame.sprite.groupcollide(bullets, aliens, True, True)
+    collisions = spatial_hash.groupcollide(bullets, aliens, True, True)
     
     if collisions:
         for aliens in collisions.values():
@@ -137,19 +223,18 @@ def check_bullet_alien_collisions(ai_settings, screen, stats, sb, ship,
         stats.level += 1
         sb.prep_level()
         
-        create_fleet(ai_settings, screen, ship, aliens)
+        # Pause, then bring on the next fleet.
+        start_pause(ai_settings, screen, stats, sb, ship, aliens, bullets,
+            LEVEL_TRANSITION, ai_settings.level_pause)
     
 def check_fleet_edges(ai_settings, aliens):
     """Respond appropriately if any aliens have reached an edge."""
-    for alien in aliens.sprites():
-        if alien.check_edges():
-            change_fleet_direction(ai_settings, aliens)
-            break
+    if aliens.check_edges():
+        change_fleet_direction(ai_settings, aliens)
         
 def change_fleet_direction(ai_settings, aliens):
     """Drop the entire fleet, and change the fleet's direction."""
-    for alien in aliens.sprites():
-        alien.rect.y += ai_settings.fleet_drop_speed
+    aliens.drop(ai_settings.fleet_drop_speed)
     ai_settings.fleet_direction *= -1
     
 def ship_hit(ai_settings, screen, stats, sb, ship, aliens, bullets):
@@ -161,41 +246,33 @@ def ship_hit(ai_settings, screen, stats, sb, ship, aliens, bullets):
         # Update scoreboard.
         sb.prep_ships()
         
+        # Hold the scene still for a moment, then bring on a new fleet.
+        start_pause(ai_settings, screen, stats, sb, ship, aliens, bullets,
+            RESPAWNING, ai_settings.ship_hit_pause)
+        
     else:
-        stats.game_active = False
+        stats.set_state(GAME_OVER)
         pygame.mouse.set_visible(True)
-    
-    # Empty the list of aliens and bullets.
-    aliens.empty()
-    bullets.empty()
-    
-    # Create a new fleet, and center the ship.
-    create_fleet(ai_settings, screen, ship, aliens)
-    ship.center_ship()
-    
-    # Pause.
-    sleep(0.5)
+        reset_fleet(ai_settings, screen, ship, aliens, bullets)
     
 def check_aliens_bottom(ai_settings, screen, stats, sb, ship, aliens,
         bullets):
     """Check if any aliens have reached the bottom of the screen."""
-    screen_rect = screen.get_rect()
-    for alien in aliens.sprites():
-        if alien.rect.bottom >= screen_rect.bottom:
-            # Treat this the same as if the ship got hit.
-            ship_hit(ai_settings, screen, stats, sb, ship, aliens, bullets)
-            break
+    # A ship that was just hit this step can't be hit again.
+    if stats.state == ACTIVE and aliens.check_bottom():
+        # Treat this the same as if the ship got hit.
+        ship_hit(ai_settings, screen, stats, sb, ship, aliens, bullets)
             
-def update_aliens(ai_settings, screen, stats, sb, ship, aliens, bullets):
+def update_aliens(ai_settings, screen, stats, sb, ship, aliens, bullets, dt):
     """
     Check if the fleet is at an edge,
       then update the postions of all aliens in the fleet.
     """
     check_fleet_edges(ai_settings, aliens)
-    aliens.update()
+    aliens.update(dt)
     
     # Look for alien-ship collisions.
-    if pygame.sprite.spritecollideany(ship, aliens):
+    if spatial_hash.spritecollideany(ship, aliens):
         ship_hit(ai_settings, screen, stats, sb, ship, aliens, bullets)
 
     # Look for aliens hitting the bottom of the screen.
@@ -219,6 +296,7 @@ def create_alien(ai_settings, screen, aliens, alien_number, row_number):
     alien = Alien(ai_settings, screen)
     alien_width = alien.rect.width
     alien.x = alien_width + 2 * alien_width * alien_number
+    alien.previous_x = alien.x
     alien.rect.x = alien.x
     alien.rect.y = alien.rect.height + 2 * alien.rect.height * row_number
     aliens.add(alien)
@@ -1,3 +1,10 @@
+# The states a game can be in. Only an active game moves; respawning and
+#   level transitions are short pauses that end on their own.
+ACTIVE = 'active'
+RESPAWNING = 'respawning'
+LEVEL_TRANSITION = 'level transition'
+GAME_OVER = 'game over'
+
 class GameStats():
     """Track statistics for Alien Invasion."""
     
@@ -7,7 +14,7 @@ class GameStats():
         self.reset_stats()
         
         # Start game in an inactive state.
-        self.game_active = False
+        self.set_state(GAME_OVER)
         
         # High score should never be reset.
         self.high_score = 0
@@ -17,3 +24,13 @@ class GameStats():
         self.ships_left = self.ai_settings.ship_limit
         self.score = 0
         self.level = 1
+
+    def set_state(self, state, pause=0.0):
+        """Change to state, and stay there for pause seconds of game time."""
+        self.state = state
+        self.pause_left = pause
+
+    @property
+    def game_active(self):
+        """True while a game is being played, even if it's paused."""
+        return self.state != GAME_OVER
@@ -0,0 +1,230 @@
+import argparse
+import os
+from random import Random
+from statistics import mean, median
+from time import perf_counter
+
+import pygame
+
+from settings import Settings
+from game_stats import GameStats
+from ship import Ship
+from fleet import Fleet
+from bullet_pool import BulletPool
+import game_functions as gf
+import image_cache
+
+class HeadlessScoreboard():
+    """A scoreboard that keeps no images, for games nobody watches."""
+
+    def prep_score(self):
+        pass
+
+    def prep_high_score(self):
+        pass
+
+    def prep_level(self):
+        pass
+
+    def prep_ships(self):
+        pass
+
+
+class RandomPolicy():
+    """Press random keys, like a player mashing the keyboard."""
+
+    def __init__(self, seed, change_chance=0.02, fire_chance=0.1):
+        """Initialize the policy with its own random number generator."""
+        self.random = Random(seed)
+        self.change_chance = change_chance
+        self.fire_chance = fire_chance
+        self.held_key = None
+
+    def events(self, tick, ship):
+        """Return the key events to send on this tick."""
+        events = []
+        if self.random.random() < self.change_chance:
+            # Let go of the arrow key being held, and maybe press another.
+            if self.held_key:
+                events.append(key_event(pygame.KEYUP, self.held_key))
+            self.held_key = self.random.choice(
+                [None, pygame.K_LEFT, pygame.K_RIGHT])
+            if self.held_key:
+                events.append(key_event(pygame.KEYDOWN, self.held_key))
+        if self.random.random() < self.fire_chance:
+            events.append(key_event(pygame.KEYDOWN, pygame.K_SPACE))
+        return events
+
+
+class SweepPolicy():
+    """Sweep from edge to edge, firing at a steady rate."""
+
+    def __init__(self, seed, fire_every=10):
+        """Initialize the policy; the seed only picks the first direction."""
+        self.fire_every = fire_every
+        self.held_key = Random(seed).choice([pygame.K_LEFT, pygame.K_RIGHT])
+        self.started = False
+
+    def events(self, tick, ship):
+        """Return the key events to send on this tick."""
+        events = []
+        if not self.started:
+            events.append(key_event(pygame.KEYDOWN, self.held_key))
+            self.started = True
+
+        # Turn around at the edges of the screen.
+        if self.held_key == pygame.K_RIGHT:
+            at_edge = ship.rect.right >= ship.screen_rect.right
+        else:
+            at_edge = ship.rect.left <= 0
+        if at_edge:
+            events.append(key_event(pygame.KEYUP, self.held_key))
+            if self.held_key == pygame.K_RIGHT:
+                self.held_key = pygame.K_LEFT
+            else:
+                self.held_key = pygame.K_RIGHT
+            events.append(key_event(pygame.KEYDOWN, self.held_key))
+
+        if tick % self.fire_every == 0:
+            events.append(key_event(pygame.KEYDOWN, pygame.K_SPACE))
+        return events
+
+
+POLICIES = {'random': RandomPolicy, 'sweep': SweepPolicy}
+
+def key_event(event_type, key):
+    """Return a pygame key event, as if a key had been pressed."""
+    return pygame.event.Event(event_type, key=key)
+
+def init_headless(ai_settings):
+    """Start pygame without a window, and return a screen to simulate on."""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.display.init()
+    screen = pygame.display.set_mode(
+        (ai_settings.screen_width, ai_settings.screen_height))
+    image_cache.preload(['images/alien.bmp', 'images/ship.bmp'])
+    return screen
+
+def play_game(ai_settings, screen, policy, max_ticks):
+    """
+    Play one game with no display, steering the ship with policy.
+      Return a dict describing how the game went.
+    """
+    # Nobody is watching, so skip the pauses after a hit and between levels.
+    ai_settings.ship_hit_pause = 0
+    ai_settings.level_pause = 0
+
+    stats = GameStats(ai_settings)
+    sb = HeadlessScoreboard()
+    ship = Ship(ai_settings, screen)
+    bullets = BulletPool(ai_settings, screen, ship)
+    aliens = Fleet(ai_settings, screen)
+    gf.start_game(ai_settings, screen, stats, sb, ship, aliens, bullets)
+
+    dt = 1 / ai_settings.steps_per_second
+    tick = 0
+
+    # The tick each level started on, and the score when it started.
+    level_starts = [0]
+    level_scores = [0]
+
+    while stats.game_active and tick < max_ticks:
+        bullets.new_frame()
+        for event in policy.events(tick, ship):
+            if event.type == pygame.KEYDOWN:
+                gf.check_keydown_events(event, ai_settings, screen, stats,
+                    ship, bullets)
+            elif event.type == pygame.KEYUP:
+                gf.check_keyup_events(event, ship)
+
+        if gf.update_game_state(ai_settings, screen, stats, sb, ship, aliens,
+                bullets, dt):
+            ship.update(dt)
+            gf.update_bullets(ai_settings, screen, stats, sb, ship, aliens,
+                bullets, dt)
+            gf.update_aliens(ai_settings, screen, stats, sb, ship, aliens,
+                bullets, dt)
+        tick += 1
+
+        if stats.level > len(level_starts):
+            level_starts.append(tick)
+            level_scores.append(stats.score)
+
+    return {'ticks': tick, 'level': stats.level, 'score': stats.score,
+        'finished': not stats.game_active, 'shots': bullets.shots,
+        'bullets_made': bullets.allocations, 'level_starts': level_starts,
+        'level_scores': level_scores}
+
+def make_settings(args):
+    """Return game settings, with any difficulty overrides from args."""
+    ai_settings = Settings()
+    if args.speedup_scale is not None:
+        ai_settings.speedup_scale = args.speedup_scale
+    if args.score_scale is not None:
+        ai_settings.score_scale = args.score_scale
+    return ai_settings
+
+def print_report(results, seconds, ai_settings):
+    """Print throughput, levels reached, and the score distribution."""
+    total_ticks = sum(result['ticks'] for result in results)
+    print("Played {} games: {:,} ticks in {:.2f} s ({:,.0f} ticks/sec, "
+        "{:.0f}x real time).".format(len(results), total_ticks, seconds,
+        total_ticks / seconds,
+        total_ticks / ai_settings.steps_per_second / seconds))
+    unfinished = len([result for result in results if not result['finished']])
+    if unfinished:
+        print("{} games hit the tick limit before game over.".format(
+            unfinished))
+
+    print("{:,} shots fired, from {:,} bullets made.".format(
+        sum(result['shots'] for result in results),
+        sum(result['bullets_made'] for result in results)))
+
+    print("\nLevels reached:")
+    levels = [result['level'] for result in results]
+    for level in range(min(levels), max(levels) + 1):
+        print("  level {:>3}: {}".format(level, levels.count(level)))
+
+    scores = sorted(result['score'] for result in results)
+    print("\nScores: min {:,}, median {:,.0f}, mean {:,.0f}, max {:,}".format(
+        scores[0], median(scores), mean(scores), scores[-1]))
+    number_buckets = min(10, len(scores))
+    bucket_size = max(1, (scores[-1] - scores[0]) // number_buckets + 1)
+    for bucket in range(number_buckets):
+        low = scores[0] + bucket * bucket_size
+        count = len([score for score in scores
+            if low <= score < low + bucket_size])
+        print("  {:>10,} - {:>10,}: {}".format(low, low + bucket_size - 1,
+            count))
+
+def main():
+    """Run a batch of headless games from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Play Alien Invasion with no display, as fast as "
+            "possible, and report on the games.")
+    parser.add_argument('--games', type=int, default=10,
+        help="number of games to play")
+    parser.add_argument('--max-ticks', type=int, default=200000,
+        help="stop any game that runs longer than this many ticks")
+    parser.add_argument('--policy', choices=sorted(POLICIES),
+        default='random', help="how the ship is steered")
+    parser.add_argument('--seed', type=int, default=1,
+        help="seed for the first game; each game adds one")
+    parser.add_argument('--speedup-scale', type=float,
+        help="override Settings.speedup_scale")
+    parser.add_argument('--score-scale', type=float,
+        help="override Settings.score_scale")
+    args = parser.parse_args()
+
+    screen = init_headless(make_settings(args))
+    results = []
+    start = perf_counter()
+    for game_number in range(args.games):
+        ai_settings = make_settings(args)
+        policy = POLICIES[args.policy](args.seed + game_number)
+        results.append(play_game(ai_settings, screen, policy,
+            args.max_ticks))
+    print_report(results, perf_counter() - start, ai_settings)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+import csv
+import json
+from collections import deque
+from time import perf_counter
+
+from spatial_hash import collision_stats
+
+# The phases of the main loop, in the order they run.
+PHASES = ['events', 'ship', 'bullets', 'aliens', 'draw', 'flip']
+
+# Counts recorded for each frame, alongside the phase timings.
+COUNTS = ['steps', 'aliens', 'bullets', 'lookups', 'hits']
+
+# The columns of an exported frame.
+EXPORT_HEADER = (['frame'] + [phase + '_ms' for phase in PHASES] +
+    ['total_ms'] + COUNTS)
+
+PERCENTILES = [50, 95, 99]
+
+class PhaseTimer():
+    """Time one phase of the loop, adding to the current frame's total."""
+
+    def __init__(self, frame_times, name):
+        """Initialize the timer for the phase called name."""
+        self.frame_times = frame_times
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.frame_times[self.name] += perf_counter() - self.start
+
+
+class PhaseProfiler():
+    """Collect the time each phase of the main loop takes, every frame."""
+
+    def __init__(self, ai_settings):
+        """Initialize empty timings, and one reusable timer per phase."""
+        self.ai_settings = ai_settings
+
+        # Time spent in each phase during the current frame.
+        self.frame_times = {phase: 0.0 for phase in PHASES}
+        self.timers = {phase: PhaseTimer(self.frame_times, phase)
+            for phase in PHASES}
+        self.steps = 0
+        self.last_collision_stats = dict(collision_stats)
+
+        # The most recent frames, in milliseconds, for rolling percentiles,
+        #   and the slowest time of the whole session.
+        self.recent = {name: deque(maxlen=ai_settings.profile_window)
+            for name in PHASES + ['total']}
+        self.max_times = {name: 0.0 for name in PHASES + ['total']}
+
+        # How many frames have ended, and the last one's counts.
+        self.frames = 0
+        self.counts = {name: 0 for name in COUNTS}
+
+        # Each frame is written to the export file as it ends, instead of
+        #   being kept, so a long session doesn't fill memory.
+        self.export_file = None
+        self.writer = None
+        if ai_settings.profile_export_path:
+            self.start_export(ai_settings.profile_export_path)
+
+    def phase(self, name):
+        """Return a context manager that times the phase called name."""
+        return self.timers[name]
+
+    def count_step(self):
+        """Note that one fixed step ran in this frame."""
+        self.steps += 1
+
+    def end_frame(self, aliens, bullets):
+        """Store the current frame's timings and counts, and start anew."""
+        times = [self.frame_times[phase] * 1000 for phase in PHASES]
+        times.append(sum(times))
+        for name, time in zip(PHASES + ['total'], times):
+            self.recent[name].append(time)
+            if time > self.max_times[name]:
+                self.max_times[name] = time
+
+        lookups = (collision_stats['lookups'] -
+            self.last_collision_stats['lookups'])
+        hits = collision_stats['hits'] - self.last_collision_stats['hits']
+        self.last_collision_stats = dict(collision_stats)
+        self.counts = dict(zip(COUNTS, [self.steps, len(aliens),
+            len(bullets), lookups, hits]))
+        if self.export_file:
+            self.write_row([self.frames] + times + list(self.counts.values()))
+        self.frames += 1
+
+        for phase in PHASES:
+            self.frame_times[phase] = 0.0
+        self.steps = 0
+
+    def percentiles(self, name):
+        """Return the p50, p95, and p99 of the recent times for name."""
+        return percentiles(self.recent[name])
+
+    def last_counts(self):
+        """Return a dict of the counts recorded for the last frame."""
+        return self.counts
+
+    def summary(self):
+        """
+        Return a table of percentiles for every phase over the recent
+          frames, and the slowest time over the whole session.
+        """
+        lines = ["Phase times over the last {} of {} frames, and the "
+                "slowest of all (ms):".format(len(self.recent['total']),
+                self.frames),
+            "  phase        p50      p95      p99      max"]
+        for name in PHASES + ['total']:
+            values = self.percentiles(name) + [self.max_times[name]]
+            lines.append("  {:<7}".format(name) + "".join(
+                "{:>9.3f}".format(value) for value in values))
+        return "\n".join(lines)
+
+    def start_export(self, path):
+        """Start saving every frame's timings and counts, as JSON or CSV."""
+        self.export_file = open(path, 'w', newline='')
+        if path.endswith('.json'):
+            # The frames are written one at a time inside a JSON list,
+            #   which close() ends.
+            self.export_file.write('{"frames": [')
+        else:
+            self.writer = csv.writer(self.export_file)
+            self.writer.writerow(EXPORT_HEADER)
+
+    def write_row(self, row):
+        """Write one frame to the export file."""
+        if self.writer:
+            self.writer.writerow(row)
+        else:
+            separator = ', ' if self.frames else ''
+            self.export_file.write(separator +
+                json.dumps(dict(zip(EXPORT_HEADER, row))))
+
+    def close(self):
+        """
+        Finish the export file, if there is one. A JSON file also gets the
+          percentiles of the recent frames, and the slowest times.
+        """
+        if not self.export_file:
+            return
+        if not self.writer:
+            summary = {name: dict(zip(['p50', 'p95', 'p99'],
+                    self.percentiles(name)), max=self.max_times[name])
+                for name in PHASES + ['total']}
+            self.export_file.write('], "percentiles_ms": {}, '
+                '"percentile_frames": {}}}'.format(json.dumps(summary),
+                len(self.recent['total'])))
+        self.export_file.close()
+        self.export_file = None
+        self.writer = None
+
+
+class ProfileOverlay():
+    """Show the rolling phase timings in a corner of the screen."""
+
+    def __init__(self, ai_settings, font, profiler):
+        """Initialize the overlay, drawn with the scoreboard's font."""
+        self.ai_settings = ai_settings
+        self.font = font
+        self.profiler = profiler
+        self.text_color = (30, 30, 30)
+        self.next_refresh = 0
+        self.images = []
+
+    def refresh(self):
+        """
+        Render the latest numbers, but only every few frames, since text
+          rendering is slow and numbers that change every frame can't be
+          read anyway.
+        """
+        frames = self.profiler.frames
+        if frames < self.next_refresh:
+            return
+        self.next_refresh = frames + self.ai_settings.profile_overlay_refresh
+
+        lines = ["phase   p50 / p95 / p99 ms"]
+        for name in PHASES + ['total']:
+            lines.append("{:<7} {:.2f} / {:.2f} / {:.2f}".format(name,
+                *self.profiler.percentiles(name)))
+        lines.append("aliens {aliens}  bullets {bullets}  hits {hits}".format(
+            **self.profiler.last_counts()))
+
+        # List the lines down the left side, below the ships that are left.
+        self.images = []
+        top = 70
+        for line in lines:
+            image = self.font.render(line, True, self.text_color,
+                self.ai_settings.bg_color)
+            rect = image.get_rect()
+            rect.left = 10
+            rect.top = top
+            top = rect.bottom
+            self.images.append((rect, image))
+
+    def regions(self):
+        """Return the (rect, image) pairs the overlay draws."""
+        return self.images
+
+    def draw(self, screen):
+        """Draw the overlay to the screen."""
+        for rect, image in self.images:
+            screen.blit(image, rect)
+
+
+def percentiles(values):
+    """Return the p50, p95, and p99 of values, by the nearest-rank method."""
+    if not values:
+        return [0.0 for percentile in PERCENTILES]
+    ordered = sorted(values)
+    return [ordered[max(0, -(-len(ordered) * percentile // 100) - 1)]
+        for percentile in PERCENTILES]
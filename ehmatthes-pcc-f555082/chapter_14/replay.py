@@ -0,0 +1,219 @@
+import argparse
+import json
+import os
+import random
+from time import perf_counter
+
+import pygame
+
+from settings import Settings
+from game_stats import GameStats
+from scoreboard import Scoreboard
+from button import Button
+from ship import Ship
+from fleet import Fleet
+from bullet_pool import BulletPool
+from dirty_renderer import DirtyRenderer
+from headless import HeadlessScoreboard
+import game_functions as gf
+import image_cache
+
+# The events the game responds to, and the attributes it reads from them.
+RECORDED_EVENTS = {
+    pygame.QUIT: [],
+    pygame.KEYDOWN: ['key'],
+    pygame.KEYUP: ['key'],
+    pygame.MOUSEBUTTONDOWN: ['pos', 'button'],
+    }
+
+PHASES = ['events', 'ship', 'bullets', 'aliens', 'draw']
+
+class InputRecorder():
+    """
+    Pass pygame's events on to the game, and write down which frame each
+      one arrived in, and how many steps each frame ran.
+    """
+
+    def __init__(self, ai_settings):
+        """Start an empty recording of a game with these settings."""
+        self.settings = {name: value
+            for name, value in vars(ai_settings).items()
+            if name != 'record_path'}
+        self.seed = ai_settings.random_seed
+
+        # Each frame is a list of [steps, events]; each event is a list of
+        #   [milliseconds since pygame.init(), type, attributes].
+        self.frames = []
+
+    def start_frame(self, steps):
+        """Start recording a new frame, which will run this many steps."""
+        self.frames.append([steps, []])
+
+    def get(self):
+        """Return pygame's events, recording the ones the game uses."""
+        events = pygame.event.get()
+        frame_events = self.frames[-1][1]
+        for event in events:
+            if event.type in RECORDED_EVENTS:
+                attributes = {name: getattr(event, name)
+                    for name in RECORDED_EVENTS[event.type]}
+                frame_events.append([pygame.time.get_ticks(), event.type,
+                    attributes])
+        return events
+
+    def save(self, path, stats):
+        """Write the recording to path, with the state the game ended in."""
+        recording = {
+            'seed': self.seed,
+            'settings': self.settings,
+            'frames': self.frames,
+            'result': summarize(stats),
+            }
+        with open(path, 'w') as f_obj:
+            json.dump(recording, f_obj)
+
+
+class InputReplay():
+    """Feed a recorded session's events back to the game, frame by frame."""
+
+    def __init__(self, path):
+        """Load a recording made by InputRecorder."""
+        with open(path) as f_obj:
+            recording = json.load(f_obj)
+        self.seed = recording['seed']
+        self.settings = recording['settings']
+        self.frames = recording['frames']
+        self.result = recording['result']
+        self.events = []
+
+    def apply_settings(self, ai_settings):
+        """Give ai_settings the values the recorded game started with."""
+        for name, value in self.settings.items():
+            # JSON turns tuples, like colors, into lists.
+            if isinstance(value, list):
+                value = tuple(value)
+            setattr(ai_settings, name, value)
+
+    def play_frames(self):
+        """Yield the number of steps in each recorded frame, in order."""
+        for steps, events in self.frames:
+            self.events = [pygame.event.Event(event_type,
+                    {name: tuple(value) if isinstance(value, list) else value
+                    for name, value in attributes.items()})
+                for milliseconds, event_type, attributes in events]
+            yield steps
+
+    def get(self):
+        """Return the events recorded for the current frame."""
+        return self.events
+
+
+def summarize(stats):
+    """Return the parts of the game state a replay should reproduce."""
+    return {'score': stats.score, 'high_score': stats.high_score,
+        'level': stats.level, 'ships_left': stats.ships_left,
+        'game_active': stats.game_active}
+
+def replay_session(path, render):
+    """
+    Replay a recorded session as fast as possible, drawing each frame if
+      render is True. Return the time spent in each phase of the loop.
+    """
+    replay = InputReplay(path)
+    ai_settings = Settings()
+    replay.apply_settings(ai_settings)
+
+    if not render:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    pygame.init()
+    screen = pygame.display.set_mode(
+        (ai_settings.screen_width, ai_settings.screen_height))
+    image_cache.preload(['images/alien.bmp', 'images/ship.bmp'])
+    random.seed(replay.seed)
+
+    # Set up the game the same way run_game() does.
+    play_button = Button(ai_settings, screen, "Play")
+    stats = GameStats(ai_settings)
+    if render:
+        sb = Scoreboard(ai_settings, screen, stats)
+    else:
+        sb = HeadlessScoreboard()
+    ship = Ship(ai_settings, screen)
+    bullets = BulletPool(ai_settings, screen, ship)
+    aliens = Fleet(ai_settings, screen)
+    gf.create_fleet(ai_settings, screen, ship, aliens)
+    renderer = DirtyRenderer(ai_settings, screen)
+
+    dt = 1 / ai_settings.steps_per_second
+    timings = {phase: 0.0 for phase in PHASES}
+    frames = 0
+    total_steps = 0
+    try:
+        for steps in replay.play_frames():
+            frames += 1
+            total_steps += steps
+            start = perf_counter()
+            gf.check_events(ai_settings, screen, stats, sb, play_button,
+                ship, aliens, bullets, replay)
+            timings['events'] += perf_counter() - start
+
+            for step in range(steps):
+                if gf.update_game_state(ai_settings, screen, stats, sb,
+                        ship, aliens, bullets, dt):
+                    start = perf_counter()
+                    ship.update(dt)
+                    timings['ship'] += perf_counter() - start
+
+                    start = perf_counter()
+                    gf.update_bullets(ai_settings, screen, stats, sb, ship,
+                        aliens, bullets, dt)
+                    timings['bullets'] += perf_counter() - start
+
+                    start = perf_counter()
+                    gf.update_aliens(ai_settings, screen, stats, sb, ship,
+                        aliens, bullets, dt)
+                    timings['aliens'] += perf_counter() - start
+
+            if render:
+                start = perf_counter()
+                gf.update_screen(ai_settings, screen, stats, sb, ship,
+                    aliens, bullets, play_button, renderer)
+                timings['draw'] += perf_counter() - start
+    except SystemExit:
+        # The recorded player quit here.
+        pass
+
+    print_timings(timings, frames, total_steps)
+    if summarize(stats) == replay.result:
+        print("Final state matches the recording.")
+    else:
+        print("Final state doesn't match the recording:")
+        print("  recorded: {}".format(replay.result))
+        print("  replayed: {}".format(summarize(stats)))
+    return timings
+
+def print_timings(timings, frames, total_steps):
+    """Print the total and per-frame time spent in each phase."""
+    total_time = sum(timings.values())
+    print("Replayed {:,} frames ({:,} steps) in {:.3f} s.".format(frames,
+        total_steps, total_time))
+    print("  phase     total (ms)  per frame (us)  share")
+    for phase in PHASES:
+        print("  {:<8} {:>11.1f}  {:>14.1f}  {:>5.1%}".format(phase,
+            timings[phase] * 1000, timings[phase] / max(frames, 1) * 1e6,
+            timings[phase] / max(total_time, 1e-9)))
+
+def main():
+    """Replay a recorded session from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded Alien Invasion session, and time "
+            "each phase of the game loop.")
+    parser.add_argument('path', help="a recording saved by setting "
+        "Settings.record_path")
+    parser.add_argument('--render', action='store_true',
+        help="draw every frame, instead of only simulating")
+    args = parser.parse_args()
+    replay_session(args.path, args.render)
+
+if __name__ == '__main__':
+    main()
@@ -17,40 +17,92 @@ class Scoreboard():
         self.text_color = (30, 30, 30)
         self.font = pygame.font.SysFont(None, 48)
 
+        # The text each image shows, so unchanged text isn't rebuilt, and
+        #   how many times text has been rendered.
+        self.score_str = None
+        self.high_score_str = None
+        self.level_str = None
+        self.renders = 0
+
+        # An optional overlay, such as the profiler's, drawn with the score.
+        self.overlay = None
+
         # Prepare the initial score images.
         self.prep_score()
         self.prep_high_score()
         self.prep_level()
         self.prep_ships()
+        self.update_images()
 
     def prep_score(self):
+        """Mark the score image as out of date."""
+        # Several hits in one frame only rebuild the image once, when the
+        #   scoreboard is next drawn.
+        self.score_stale = True
+
+    def prep_high_score(self):
+        """Mark the high score image as out of date."""
+        self.high_score_stale = True
+
+    def prep_level(self):
+        """Mark the level image as out of date."""
+        self.level_stale = True
+
+    def update_images(self):
+        """Rebuild any text images that are out of date."""
+        if self.score_stale:
+            self.render_score()
+        if self.high_score_stale:
+            self.render_high_score()
+        if self.level_stale:
+            self.render_level()
+        if self.overlay:
+            self.overlay.refresh()
+
+    def render_text(self, text):
+        """Return an image of text, in the scoreboard's font and colours."""
+        self.renders += 1
+        return self.font.render(text, True, self.text_color,
+            self.ai_settings.bg_color)
+
+    def render_score(self):
         """Turn the score into a rendered image."""
+        self.score_stale = False
         rounded_score = int(round(self.stats.score, -1))
         score_str = "{:,}".format(rounded_score)
-        self.score_image = self.font.render(score_str, True, self.text_color,
-            self.ai_settings.bg_color)
+        if score_str == self.score_str:
+            return
+        self.score_str = score_str
+        self.score_image = self.render_text(score_str)
             
         # Display the score at the top right of the screen.
         self.score_rect = self.score_image.get_rect()
         self.score_rect.right = self.screen_rect.right - 20
         self.score_rect.top = 20
         
-    def prep_high_score(self):
+    def render_high_score(self):
         """Turn the high score into a rendered image."""
+        self.high_score_stale = False
         high_score = int(round(self.stats.high_score, -1))
         high_score_str = "{:,}".format(high_score)
-        self.high_score_image = self.font.render(high_score_str, True,
-            self.text_color, self.ai_settings.bg_color)
+        if high_score_str == self.high_score_str:
+            return
+        self.high_score_str = high_score_str
+        self.high_score_image = self.render_text(high_score_str)
                 
         # Center the high score at the top of the screen.
         self.high_score_rect = self.high_score_image.get_rect()
         self.high_score_rect.centerx = self.screen_rect.centerx
         self.high_score_rect.top = self.score_rect.top
         
-    def prep_level(self):
+    def render_level(self):
         """Turn the level into a rendered image."""
-        self.level_image = self.font.render(str(self.stats.level), True,
-                self.text_color, self.ai_settings.bg_color)
+        self.level_stale = False
+        level_str = str(self.stats.level)
+        if level_str == self.level_str:
+            return
+        self.level_str = level_str
+        self.level_image = self.render_text(level_str)
         
         # Position the level below the score.
         self.level_rect = self.level_image.get_rect()
@@ -66,10 +118,25 @@ class Scoreboard():
             ship.rect.y = 10
             self.ships.add(ship)
         
+    def regions(self):
+        """Return the (rect, image) pairs that show_score() draws."""
+        self.update_images()
+        regions = [(self.score_rect, self.score_image),
+            (self.high_score_rect, self.high_score_image),
+            (self.level_rect, self.level_image)]
+        for ship in self.ships.sprites():
+            regions.append((ship.rect, ship.image))
+        if self.overlay:
+            regions.extend(self.overlay.regions())
+        return regions
+
     def show_score(self):
         """Draw score to the screen."""
+        self.update_images()
         self.screen.blit(self.score_image, self.score_rect)
         self.screen.blit(self.high_score_image, self.high_score_rect)
         self.screen.blit(self.level_image, self.level_rect)
         # Draw ships.
         self.ships.draw(self.screen)
+        if self.overlay:
+            self.overlay.draw(self.screen)
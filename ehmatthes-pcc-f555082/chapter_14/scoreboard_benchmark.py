@@ -0,0 +1,58 @@
+import os
+from random import Random
+from timeit import timeit
+
+import pygame
+
+from settings import Settings
+from game_stats import GameStats
+from scoreboard import Scoreboard
+
+def render_each_hit_frame(sb, scores):
+    """Score hits the old way: render the whole string for every hit."""
+    for score in scores:
+        score_str = "{:,}".format(int(round(score, -1)))
+        sb.score_image = sb.font.render(score_str, True, sb.text_color,
+            sb.ai_settings.bg_color)
+    sb.show_score()
+
+def render_once_frame(sb, scores):
+    """Score hits the new way: mark the score stale, and draw once."""
+    for score in scores:
+        sb.stats.score = score
+        sb.prep_score()
+    sb.show_score()
+
+# Run without a window, so the benchmark works anywhere.
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pygame.init()
+ai_settings = Settings()
+screen = pygame.display.set_mode(
+    (ai_settings.screen_width, ai_settings.screen_height))
+stats = GameStats(ai_settings)
+sb = Scoreboard(ai_settings, screen, stats)
+random = Random(1)
+
+# A frame where several bullets hit aliens, each one changing the score.
+print("Hits in one frame, then drawing the scoreboard:")
+print("  hits  render per hit (us)  render once per frame (us)  speedup")
+frames = 1000
+for hits in [1, 3, 10]:
+    frame_scores = [[random.randrange(0, 10**7, 10) for hit in range(hits)]
+        for frame in range(frames)]
+    each_hit_time = timeit(lambda: [render_each_hit_frame(sb, scores)
+        for scores in frame_scores], number=1)
+    renders = sb.renders
+    once_time = timeit(lambda: [render_once_frame(sb, scores)
+        for scores in frame_scores], number=1)
+    renders = sb.renders - renders
+    print("  {:>4}  {:>19.1f}  {:>26.1f}  {:>6.1f}x  ({} renders)".format(
+        hits, each_hit_time / frames * 1e6, once_time / frames * 1e6,
+        each_hit_time / once_time, renders))
+
+# Frames where the rounded score doesn't change render nothing at all.
+renders = sb.renders
+unchanged_time = timeit(lambda: render_once_frame(sb, [stats.score]),
+    number=frames)
+print("\nUnchanged score: {:.1f} us per frame, {} renders".format(
+    unchanged_time / frames * 1e6, sb.renders - renders))
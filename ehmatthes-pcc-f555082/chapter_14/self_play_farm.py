@@ -0,0 +1,148 @@
+import argparse
+import os
+from itertools import product
+from multiprocessing import Pool
+from statistics import mean, median
+from time import perf_counter
+
+from settings import Settings
+import headless
+
+# The settings a farm can vary, and the type of each one's values.
+TUNABLE_SETTINGS = {
+    'speedup_scale': float,
+    'score_scale': float,
+    'fleet_drop_speed': int,
+    'bullets_allowed': int,
+    }
+
+# Each worker process makes its own headless screen, once.
+screen = None
+
+def init_worker():
+    """Start pygame without a window in this worker process."""
+    global screen
+    # SDL turns SIGTERM into a quit event by default, which would stop
+    #   the pool from shutting its workers down.
+    os.environ['SDL_NO_SIGNAL_HANDLERS'] = '1'
+    screen = headless.init_headless(Settings())
+
+def play_point(task):
+    """
+    Play one seeded game at one grid point. Return the point, the seed,
+      and the game's result.
+    """
+    point, policy_name, seed, max_ticks = task
+    ai_settings = Settings()
+    for name, value in point:
+        setattr(ai_settings, name, value)
+    policy = headless.POLICIES[policy_name](seed)
+    result = headless.play_game(ai_settings, screen, policy, max_ticks)
+    result['seconds_per_tick'] = 1 / ai_settings.steps_per_second
+    return point, seed, result
+
+def make_tasks(grid, games, policy_name, seed, max_ticks):
+    """
+    Return a task for every game at every grid point. Every point plays
+      the same seeds, so points are compared on the same bot behavior.
+    """
+    names = sorted(grid)
+    points = [tuple(zip(names, values))
+        for values in product(*[grid[name] for name in names])]
+    return [(point, policy_name, seed + game_number, max_ticks)
+        for point in points for game_number in range(games)]
+
+def run_farm(tasks, workers):
+    """
+    Play every task on a pool of worker processes. Return the results
+      grouped by grid point, in seed order, and the seconds it took.
+    """
+    start = perf_counter()
+    with Pool(workers, initializer=init_worker) as pool:
+        # Small games are handed out a few at a time, to cut the cost of
+        #   talking to the workers without leaving any of them idle.
+        chunksize = max(1, len(tasks) // (workers * 8))
+        finished = list(pool.imap_unordered(play_point, tasks, chunksize))
+    seconds = perf_counter() - start
+
+    # Games finish in any order, so sort them to make reports repeatable.
+    results = {}
+    for point, seed, result in sorted(finished, key=lambda item: item[:2]):
+        results.setdefault(point, []).append(result)
+    return results, seconds
+
+def level_survival(results):
+    """
+    Merge the games at one point into per-level statistics: how many
+      games reached each level, how many cleared it, how long the ship
+      survived in it, and how many points it earned there.
+    """
+    levels = {}
+    for result in results:
+        starts = result['level_starts'] + [result['ticks']]
+        scores = result['level_scores'] + [result['score']]
+        for index in range(len(result['level_starts'])):
+            level = levels.setdefault(index + 1,
+                {'reached': 0, 'cleared': 0, 'seconds': [], 'points': []})
+            level['reached'] += 1
+            if index + 1 < len(result['level_starts']):
+                level['cleared'] += 1
+            ticks = starts[index + 1] - starts[index]
+            level['seconds'].append(ticks * result['seconds_per_tick'])
+            level['points'].append(scores[index + 1] - scores[index])
+    return levels
+
+def print_report(results, seconds, workers):
+    """Print throughput, then the scores and levels at each grid point."""
+    all_results = [result for point_results in results.values()
+        for result in point_results]
+    total_ticks = sum(result['ticks'] for result in all_results)
+    print("Played {:,} games on {} workers: {:,} ticks in {:.2f} s "
+        "({:,.0f} ticks/sec, {:,.0f} per worker).".format(len(all_results),
+        workers, total_ticks, seconds, total_ticks / seconds,
+        total_ticks / seconds / workers))
+
+    for point, point_results in results.items():
+        print("\n" + ", ".join("{} = {}".format(name, value)
+            for name, value in point))
+        scores = [result['score'] for result in point_results]
+        print("  {} games: score median {:,.0f}, mean {:,.0f}, max {:,}; "
+            "mean level {:.2f}".format(len(scores), median(scores),
+            mean(scores), max(scores),
+            mean(result['level'] for result in point_results)))
+        print("  level  reached  cleared  mean survival (s)  mean points")
+        for level, stats in sorted(level_survival(point_results).items()):
+            print("  {:>5}  {:>7}  {:>7}  {:>17.1f}  {:>11,.0f}".format(
+                level, stats['reached'], stats['cleared'],
+                mean(stats['seconds']), mean(stats['points'])))
+
+def main():
+    """Run a grid of headless games across processes, from the command line."""
+    defaults = Settings()
+    parser = argparse.ArgumentParser(
+        description="Play seeded headless games over a grid of settings, "
+            "on every core, and report scores and survival per level.")
+    for name, value_type in TUNABLE_SETTINGS.items():
+        parser.add_argument('--' + name.replace('_', '-'), type=value_type,
+            nargs='+', default=[getattr(defaults, name)],
+            help="values of Settings.{} to try".format(name))
+    parser.add_argument('--games', type=int, default=20,
+        help="games to play at each grid point")
+    parser.add_argument('--policy', choices=sorted(headless.POLICIES),
+        default='random', help="how the bot steers the ship")
+    parser.add_argument('--seed', type=int, default=1,
+        help="seed for the first game at each point; each game adds one")
+    parser.add_argument('--max-ticks', type=int, default=200000,
+        help="stop any game that runs longer than this many ticks")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+        help="number of worker processes")
+    args = parser.parse_args()
+
+    grid = {name: getattr(args, name) for name in TUNABLE_SETTINGS}
+    tasks = make_tasks(grid, args.games, args.policy, args.seed,
+        args.max_ticks)
+    results, seconds = run_farm(tasks, args.workers)
+    print_report(results, seconds, args.workers)
+
+if __name__ == '__main__':
+    main()
@@ -7,9 +7,42 @@ class Settings():
         self.screen_width = 1200
         self.screen_height = 800
         self.bg_color = (230, 230, 230)
+
+        # Only redraw the regions of the screen that change each frame,
+        #   instead of the whole screen. Off unless asked for.
+        self.dirty_rect_rendering = False
         
+        # Game clock settings. The game is stepped at a fixed rate, and
+        #   frames are drawn no faster than fps_cap (0 means no cap).
+        self.steps_per_second = 120
+        self.fps_cap = 60
+        # Never simulate more than this many seconds after a slow frame.
+        self.max_frame_time = 0.25
+        # Draw sprites between their last two steps, for smoother motion.
+        self.interpolate = False
+
+        # Seed for anything random, so a recorded session plays the same
+        #   way when it's replayed.
+        self.random_seed = 1
+        # Save the player's input to this file, to be replayed later with
+        #   replay.py (None means don't record).
+        self.record_path = None
+
+        # Profiling settings. Percentiles cover the last profile_window
+        #   frames, and the overlay's numbers change every few frames.
+        self.profile_window = 300
+        self.profile_overlay = False
+        self.profile_overlay_refresh = 30
+        # Save every frame's timings to this file as the game runs, as CSV,
+        #   or as JSON if the name ends in .json (None means don't save).
+        self.profile_export_path = None
+
         # Ship settings.
         self.ship_limit = 3
+        # How long to pause, in seconds, after the ship is hit, and before
+        #   the fleet for a new level arrives.
+        self.ship_hit_pause = 0.5
+        self.level_pause = 0.5
             
         # Bullet settings.
         self.bullet_width = 3
@@ -19,6 +52,8 @@ class Settings():
         
         # Alien settings.
         self.fleet_drop_speed = 10
+        # Draw the fleet as one image, rebuilt only when an alien dies.
+        self.fleet_layer = True
             
         # How quickly the game speeds up.
         self.speedup_scale = 1.1
@@ -29,9 +64,10 @@ class Settings():
 
     def initialize_dynamic_settings(self):
         """Initialize settings that change throughout the game."""
-        self.ship_speed_factor = 1.5
-        self.bullet_speed_factor = 3
-        self.alien_speed_factor = 1
+        # Speeds are in pixels per second.
+        self.ship_speed_factor = 300
+        self.bullet_speed_factor = 600
+        self.alien_speed_factor = 200
         
         # Scoring.
         self.alien_points = 50
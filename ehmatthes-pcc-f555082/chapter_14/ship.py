@@ -1,6 +1,7 @@
-import pygame
 from pygame.sprite import Sprite
 
+from image_cache import load_image
+
 class Ship(Sprite):
 
     def __init__(self, ai_settings, screen):
@@ -9,8 +10,8 @@ class Ship(Sprite):
         self.screen = screen
         self.ai_settings = ai_settings
 
-        # Load the ship image, and get its rect.
-        self.image = pygame.image.load('images/ship.bmp')
+        # Load the shared ship image, and get its rect.
+        self.image = load_image('images/ship.bmp')
         self.rect = self.image.get_rect()
         self.screen_rect = screen.get_rect()
 
@@ -18,8 +19,10 @@ class Ship(Sprite):
         self.rect.centerx = self.screen_rect.centerx
         self.rect.bottom = self.screen_rect.bottom
         
-        # Store a decimal value for the ship's center.
+        # Store a decimal value for the ship's center, and where it was
+        #   before the last step.
         self.center = float(self.rect.centerx)
+        self.previous_center = self.center
         
         # Movement flags.
         self.moving_right = False
@@ -28,18 +31,27 @@ class Ship(Sprite):
     def center_ship(self):
         """Center the ship on the screen."""
         self.center = self.screen_rect.centerx
+        self.previous_center = self.center
         
-    def update(self):
+    def update(self, dt):
         """Update the ship's position, based on movement flags."""
+        self.previous_center = self.center
+
         # Update the ship's center value, not the rect.
+        distance = self.ai_settings.ship_speed_factor * dt
         if self.moving_right and self.rect.right < self.screen_rect.right:
-            self.center += self.ai_settings.ship_speed_factor
+            self.center += distance
         if self.moving_left and self.rect.left > 0:
-            self.center -= self.ai_settings.ship_speed_factor
+            self.center -= distance
             
         # Update rect object from self.center.
         self.rect.centerx = self.center
 
+    def interpolate(self, alpha):
+        """Place the rect between the last two positions, for drawing."""
+        self.rect.centerx = (self.previous_center +
+            (self.center - self.previous_center) * alpha)
+
     def blitme(self):
         """Draw the ship at its current location."""
         self.screen.blit(self.image, self.rect)
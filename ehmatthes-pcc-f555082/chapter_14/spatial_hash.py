@@ -0,0 +1,87 @@
+# How many sprites have been looked up, and how many collisions found.
+collision_stats = {'lookups': 0, 'hits': 0}
+
+class SpatialHash():
+    """A uniform grid that buckets items by the cells their rects cover."""
+
+    def __init__(self, cell_size):
+        """Initialize an empty grid with square cells of the given size."""
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def rebuild(self, entries):
+        """Empty the grid, then insert each (rect, item) pair in order."""
+        self.cells = cells = {}
+        size = self.cell_size
+        for index, (rect, item) in enumerate(entries):
+            left, top, width, height = rect
+            entry = (index, rect, item)
+            for col in range(left // size, (left + width - 1) // size + 1):
+                for row in range(top // size, (top + height - 1) // size + 1):
+                    if (col, row) in cells:
+                        cells[col, row].append(entry)
+                    else:
+                        cells[col, row] = [entry]
+
+    def cells_for_rect(self, rect):
+        """Return the (column, row) keys of all cells a rect touches."""
+        size = self.cell_size
+        first_col, last_col = rect.left // size, (rect.right - 1) // size
+        first_row, last_row = rect.top // size, (rect.bottom - 1) // size
+        return [(col, row) for col in range(first_col, last_col + 1)
+            for row in range(first_row, last_row + 1)]
+
+    def query(self, rect):
+        """
+        Return the items whose rects overlap rect, in the order they
+          were inserted.
+        """
+        found = {}
+        for cell in self.cells_for_rect(rect):
+            for index, item_rect, item in self.cells.get(cell, ()):
+                if index not in found and rect.colliderect(item_rect):
+                    found[index] = item
+        return [found[index] for index in sorted(found)]
+
+
+def groupcollide(groupa, groupb, dokilla, dokillb):
+    """
+    Find sprites in groupa that collide with sprites in groupb.
+
+    Works like pygame.sprite.groupcollide(), and returns the same dict,
+      but groupb must be a Fleet. Instead of testing every pair,
+      groupb.query_all() looks up all the sprites in groupa on its grid.
+    """
+    collision_stats['lookups'] += len(groupa)
+    sprites_a = groupa.sprites()
+    hit_lists = groupb.query_all([sprite_a.rect for sprite_a in sprites_a])
+
+    collisions = {}
+    for sprite_a, hits in zip(sprites_a, hit_lists):
+        # A sprite killed by an earlier sprite in groupa can't be hit again.
+        if dokillb:
+            hits = [sprite_b for sprite_b in hits
+                if groupb.has_internal(sprite_b)]
+        if hits:
+            collisions[sprite_a] = hits
+            collision_stats['hits'] += len(hits)
+            if dokilla:
+                sprite_a.kill()
+            if dokillb:
+                for sprite_b in hits:
+                    sprite_b.kill()
+    return collisions
+
+def spritecollideany(sprite, group):
+    """
+    Return a sprite in group that collides with sprite, or None.
+
+    Works like pygame.sprite.spritecollideany(), for a Fleet.
+    """
+    collision_stats['lookups'] += 1
+    hits = group.query(sprite.rect)
+    hit = hits[0] if hits else None
+
+    if hit:
+        collision_stats['hits'] += 1
+    return hit
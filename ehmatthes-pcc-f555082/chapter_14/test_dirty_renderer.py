@@ -0,0 +1,89 @@
+import os
+import unittest
+
+import pygame
+
+from settings import Settings
+from game_stats import GameStats
+from scoreboard import Scoreboard
+from button import Button
+from ship import Ship
+from fleet import Fleet
+from bullet_pool import BulletPool
+from dirty_renderer import DirtyRenderer
+import game_functions as gf
+
+class DirtyRendererTestCase(unittest.TestCase):
+    """Tests for the DirtyRenderer class in 'dirty_renderer.py'."""
+
+    def setUp(self):
+        """Set up a game on a screen that doesn't need a window."""
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+        self.ai_settings = Settings()
+        self.screen = pygame.display.set_mode(
+            (self.ai_settings.screen_width, self.ai_settings.screen_height))
+        self.play_button = Button(self.ai_settings, self.screen, "Play")
+        self.stats = GameStats(self.ai_settings)
+        self.sb = Scoreboard(self.ai_settings, self.screen, self.stats)
+        self.ship = Ship(self.ai_settings, self.screen)
+        self.bullets = BulletPool(self.ai_settings, self.screen, self.ship)
+        self.aliens = Fleet(self.ai_settings, self.screen)
+        gf.create_fleet(self.ai_settings, self.screen, self.ship,
+            self.aliens)
+        self.renderer = DirtyRenderer(self.ai_settings, self.screen)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def draw_dirty_frame(self):
+        """Draw a frame with dirty rects, and return the screen's pixels."""
+        self.ai_settings.dirty_rect_rendering = True
+        gf.draw_screen(self.ai_settings, self.screen, self.stats, self.sb,
+            self.ship, self.aliens, self.bullets, self.play_button,
+            self.renderer)
+        return pygame.image.tobytes(self.screen, 'RGB')
+
+    def draw_full_frame(self):
+        """
+        Draw the same frame the usual way, and return its pixels. The
+          dirty frame is put back after, so the next one builds on it.
+        """
+        dirty_screen = self.screen.copy()
+        self.ai_settings.dirty_rect_rendering = False
+        gf.draw_screen(self.ai_settings, self.screen, self.stats, self.sb,
+            self.ship, self.aliens, self.bullets, self.play_button,
+            DirtyRenderer(self.ai_settings, self.screen))
+        full_screen = pygame.image.tobytes(self.screen, 'RGB')
+        self.screen.blit(dirty_screen, (0, 0))
+        return full_screen
+
+    def play_steps(self, num_steps, dt=1/120):
+        """Move the ship, fire, and update everything for a few steps."""
+        self.ship.moving_right = True
+        for step in range(num_steps):
+            if step % 10 == 0:
+                gf.fire_bullet(self.ai_settings, self.screen, self.ship,
+                    self.bullets)
+            self.ship.update(dt)
+            gf.update_bullets(self.ai_settings, self.screen, self.stats,
+                self.sb, self.ship, self.aliens, self.bullets, dt)
+            gf.update_aliens(self.ai_settings, self.screen, self.stats,
+                self.sb, self.ship, self.aliens, self.bullets, dt)
+
+    def test_same_screen_in_both_modes(self):
+        """Test that each frame looks the same drawn either way."""
+        # Start at the Play button, so its region has to be erased.
+        self.assertTrue(self.draw_dirty_frame() == self.draw_full_frame())
+        gf.start_game(self.ai_settings, self.screen, self.stats, self.sb,
+            self.ship, self.aliens, self.bullets)
+        for frame in range(60):
+            self.play_steps(4)
+            self.assertTrue(self.draw_dirty_frame() == self.draw_full_frame(),
+                "Screens differ on frame {}.".format(frame))
+
+        # Bullets hit aliens, so the scoreboard changed too.
+        self.assertGreater(self.stats.score, 0)
+
+
+unittest.main()
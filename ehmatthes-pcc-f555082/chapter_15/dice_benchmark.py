@@ -0,0 +1,86 @@
+from timeit import timeit
+
+import numpy as np
+
+from die import Die, count_results, roll_dice
+from die import expected_frequencies, rolls_needed, sides_pmf, sum_pmf
+
+def loop_frequencies(dice, num_rolls):
+    """Roll and count the old way: one roll() at a time, then count()."""
+    results = []
+    for roll_num in range(num_rolls):
+        results.append(sum(die.roll() for die in dice))
+    min_total = len(dice)
+    max_total = sum(die.num_sides for die in dice)
+    return [results.count(value) for value in range(min_total, max_total+1)]
+
+def direct_pmf(sides):
+    """Convolve the dice one at a time, without FFTs."""
+    pmf = np.ones(1)
+    for num_sides in sides:
+        pmf = np.convolve(pmf, np.full(num_sides, 1 / num_sides))
+    return pmf
+
+dice_sets = {
+    'D6': [Die(seed=1)],
+    'D6 + D6': [Die(seed=1), Die(seed=2)],
+    'D6 + D10': [Die(seed=1), Die(10, seed=2)],
+    'D20 + D12 + D8 + D4': [Die(20, seed=1), Die(12, seed=2), Die(8, seed=3),
+        Die(4, seed=4)],
+    }
+
+# Both ways, at sizes the loop can still manage.
+print("  dice                     rolls  loop (s)  bulk (s)  speedup")
+for name, dice in dice_sets.items():
+    for num_rolls in [1000, 50000]:
+        loop_time = timeit(lambda: loop_frequencies(dice, num_rolls),
+            number=1)
+        bulk_time = timeit(lambda: roll_dice(dice, num_rolls), number=1)
+        print("  {:<20} {:>10,}  {:>8.3f}  {:>8.4f}  {:>6.0f}x".format(name,
+            num_rolls, loop_time, bulk_time, loop_time / bulk_time))
+
+# The bulk way alone, at 10^8 rolls.
+print("\n  dice                     rolls  bulk (s)")
+for name, dice in dice_sets.items():
+    num_rolls = 10**8
+    bulk_time = timeit(lambda: roll_dice(dice, num_rolls), number=1)
+    print("  {:<20} {:>10,}  {:>8.2f}".format(name, num_rolls, bulk_time))
+
+# Counting results already in a list, both ways.
+die_1, die_2 = Die(seed=1), Die(seed=2)
+results = [die_1.roll() + die_2.roll() for roll_num in range(50000)]
+count_time = timeit(lambda: [results.count(value) for value in range(2, 13)],
+    number=1)
+bincount_time = timeit(lambda: count_results(results, 2, 12), number=1)
+print("\nCounting 50,000 results: count() {:.4f} s, bincount {:.4f} s".format(
+    count_time, bincount_time))
+
+# Exact frequencies, the first time for a set of dice and once cached.
+print("\n  dice                     exact (us)  cached (us)")
+for name, dice in dice_sets.items():
+    sides_pmf.cache_clear()
+    exact_time = timeit(lambda: expected_frequencies(dice, 50000), number=1)
+    cached_time = timeit(lambda: expected_frequencies(dice, 50000),
+        number=1000) / 1000
+    print("  {:<20}  {:>11.1f}  {:>11.1f}".format(name, exact_time * 1e6,
+        cached_time * 1e6))
+
+# A large pool, one convolution per die and with FFTs.
+pool = [Die(6)] * 100 + [Die(20)] * 20
+sides = tuple(sorted(die.num_sides for die in pool))
+fft_time = timeit(lambda: (sides_pmf.cache_clear(), sum_pmf(pool)), number=10)
+direct_time = timeit(lambda: direct_pmf(sides), number=10)
+print("\n100 D6 + 20 D20, {} totals: one convolution per die {:.2f} ms, "
+    "FFT {:.2f} ms, largest difference {:.1e}".format(len(sum_pmf(pool)),
+    direct_time / 10 * 1e3, fft_time / 10 * 1e3,
+    np.abs(sum_pmf(pool) - direct_pmf(sides)).max()))
+
+# How many rolls a simulation needs, and how often it's close enough.
+dice = dice_sets['D6 + D10']
+max_error = 0.005
+num_rolls = rolls_needed(dice, max_error)
+pmf = sum_pmf(dice)
+close_enough = sum(np.abs(np.array(roll_dice(dice, num_rolls)) / num_rolls -
+    pmf).max() <= max_error for trial in range(200))
+print("\nD6 + D10 within {} of every probability needs {:,} rolls; {} of "
+    "200 simulations were.".format(max_error, num_rolls, close_enough))
@@ -1,12 +1,115 @@
-from random import randint
+from collections import Counter
+from functools import lru_cache
+from math import ceil
+from statistics import NormalDist
+
+import numpy as np
+
+# How many rolls to make at a time when counting totals, so even 10^8
+#   rolls only need a few megabytes.
+CHUNK_SIZE = 1000000
+
+# Pools of dice with more possible totals than this are combined with
+#   FFTs instead of one convolution per die.
+FFT_MIN_TOTALS = 200
 
 class Die():
     """A class representing a single die."""
-    
-    def __init__(self, num_sides=6):
-        """Assume a six-sided die."""
+
+    def __init__(self, num_sides=6, seed=None):
+        """Assume a six-sided die. Dice with the same seed roll the same."""
         self.num_sides = num_sides
-        
+        self.rng = np.random.default_rng(seed)
+
     def roll(self):
         """"Return a random value between 1 and number of sides."""
-        return randint(1, self.num_sides)
+        return int(self.rng.integers(1, self.num_sides + 1))
+
+    def roll_many(self, num_rolls, dtype=np.int64):
+        """Return an array of num_rolls random values, all at once."""
+        return self.rng.integers(1, self.num_sides + 1, size=num_rolls,
+            dtype=dtype)
+
+
+def count_results(results, min_result, max_result):
+    """
+    Return how many times each value from min_result to max_result comes
+      up in results, in one pass.
+    """
+    counts = np.bincount(np.asarray(results) - min_result,
+        minlength=max_result - min_result + 1)
+    return counts[:max_result - min_result + 1].tolist()
+
+def roll_dice(dice, num_rolls, chunk_size=CHUNK_SIZE):
+    """
+    Roll all the dice together num_rolls times. Return a list of how many
+      times each total came up, from the smallest total to the largest.
+    """
+    min_total = len(dice)
+    max_total = sum(die.num_sides for die in dice)
+
+    # Use the smallest integer type that can hold any total.
+    dtype = np.min_scalar_type(max_total)
+
+    frequencies = np.zeros(max_total + 1, dtype=np.int64)
+    for start in range(0, num_rolls, chunk_size):
+        rolls = min(chunk_size, num_rolls - start)
+        totals = dice[0].roll_many(rolls, dtype)
+        for die in dice[1:]:
+            totals += die.roll_many(rolls, dtype)
+        frequencies += np.bincount(totals, minlength=max_total + 1)
+    return frequencies[min_total:].tolist()
+
+def sum_pmf(dice):
+    """
+    Return the exact probability of each total of the dice, from the
+      smallest total to the largest, as a read-only array.
+    """
+    return sides_pmf(tuple(sorted(die.num_sides for die in dice)))
+
+@lru_cache(maxsize=256)
+def sides_pmf(sides):
+    """Return the probability of each total for dice with these sides."""
+    num_totals = sum(sides) - len(sides) + 1
+    if num_totals < FFT_MIN_TOTALS:
+        # Add one die at a time; each convolution spreads every total so
+        #   far over the faces of the next die.
+        pmf = np.ones(1)
+        for num_sides in sides:
+            pmf = np.convolve(pmf, np.full(num_sides, 1 / num_sides))
+    else:
+        # Convolving is multiplying in the frequency domain, so each size
+        #   of die only needs one FFT, raised to the number of those dice.
+        spectrum = np.ones(num_totals // 2 + 1, dtype=complex)
+        for num_sides, count in Counter(sides).items():
+            die_pmf = np.full(num_sides, 1 / num_sides)
+            spectrum *= np.fft.rfft(die_pmf, num_totals) ** count
+        pmf = np.fft.irfft(spectrum, num_totals)
+
+        # Rounding leaves tiny negative values where the true ones are 0.
+        np.clip(pmf, 0, None, out=pmf)
+        pmf /= pmf.sum()
+
+    pmf.flags.writeable = False
+    return pmf
+
+def expected_frequencies(dice, num_rolls):
+    """
+    Return how many times each total should come up in num_rolls rolls,
+      on average, smallest total first.
+    """
+    return (sum_pmf(dice) * num_rolls).tolist()
+
+def rolls_needed(dice, max_error=0.001, confidence=0.95):
+    """
+    Return how many rolls a simulation needs for every total's share of
+      the rolls to be within max_error of its true probability, all at
+      once, with the given confidence.
+    """
+    # The share of a total with probability p has a standard error of
+    #   sqrt(p * (1 - p) / n). Splitting the allowed misses evenly across
+    #   the totals keeps the chance that any one misses under 1 - confidence.
+    pmf = sum_pmf(dice)
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / (2 * len(pmf)))
+    variance = (pmf * (1 - pmf)).max()
+    return ceil(variance * (z / max_error) ** 2)
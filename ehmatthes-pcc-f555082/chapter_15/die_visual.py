@@ -1,21 +1,12 @@
 import pygal
 
-from die import Die
+from die import Die, roll_dice
 
 # Create a D6.
 die = Die()
 
-# Make some rolls, and store results in a list.
-results = []
-for roll_num in range(1000):
-    result = die.roll()
-    results.append(result)
-    
-# Analyze the results.
-frequencies = []
-for value in range(1, die.num_sides+1):
-    frequency = results.count(value)
-    frequencies.append(frequency)
+# Make some rolls, and count how many times each result comes up.
+frequencies = roll_dice([die], 1000)
     
 # Visualize the results.
 hist = pygal.Bar()
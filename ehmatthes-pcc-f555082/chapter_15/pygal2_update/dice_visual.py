@@ -1,23 +1,15 @@
 import pygal
 
-from die import Die
+from die import Die, roll_dice, expected_frequencies
 
 # Create two D6 dice.
 die_1 = Die()
 die_2 = Die()
 
-# Make some rolls, and store results in a list.
-results = []
-for roll_num in range(1000):
-    result = die_1.roll() + die_2.roll()
-    results.append(result)
-    
-# Analyze the results.
-frequencies = []
-max_result = die_1.num_sides + die_2.num_sides
-for value in range(2, max_result+1):
-    frequency = results.count(value)
-    frequencies.append(frequency)
+# Make some rolls, and count how many times each result comes up.
+#   Work out how many times each should come up, for comparison.
+frequencies = roll_dice([die_1, die_2], 1000)
+expected = expected_frequencies([die_1, die_2], 1000)
     
 # Visualize the results.
 hist = pygal.Bar()
@@ -29,4 +21,5 @@ hist.x_title = "Result"
 hist.y_title = "Frequency of Result"
 
 hist.add('D6 + D6', frequencies)
+hist.add('Exact', expected)
 hist.render_to_file('dice_visual.svg')
@@ -1,4 +1,4 @@
-from die import Die
+from die import Die, roll_dice, expected_frequencies
 
 import pygal
 
@@ -6,18 +6,10 @@ import pygal
 die_1 = Die()
 die_2 = Die(10)
 
-# Make some rolls, and store results in a list.
-results = []
-for roll_num in range(50000):
-    result = die_1.roll() + die_2.roll()
-    results.append(result)
-    
-# Analyze the results.
-frequencies = []
-max_result = die_1.num_sides + die_2.num_sides
-for value in range(2, max_result+1):
-    frequency = results.count(value)
-    frequencies.append(frequency)
+# Make some rolls, and count how many times each result comes up.
+#   Work out how many times each should come up, for comparison.
+frequencies = roll_dice([die_1, die_2], 50000)
+expected = expected_frequencies([die_1, die_2], 50000)
     
 # Visualize the results.
 hist = pygal.Bar()
@@ -30,4 +22,5 @@ hist.x_title = "Result"
 hist.y_title = "Frequency of Result"
 
 hist.add('D10 + D10', frequencies)
+hist.add('Exact', expected)
 hist.render_to_file('dice_visual.svg')
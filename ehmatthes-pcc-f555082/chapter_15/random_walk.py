@@ -1,39 +1,155 @@
-from random import choice
+import numpy as np
+
+# How many steps to generate at a time. Large enough to keep NumPy busy,
+#   small enough that a block only takes a few tens of megabytes.
+CHUNK_SIZE = 1000000
 
 class RandomWalk():
     """A class to generate random walks."""
-    
-    def __init__(self, num_points=5000):
-        """Initialize attributes of a walk."""
+
+    def __init__(self, num_points=5000, seed=None):
+        """
+        Initialize attributes of a walk. Walks made with the same seed
+          take the same steps.
+        """
         self.num_points = num_points
-        
+        self.rng = np.random.default_rng(seed)
+
         # All walks start at (0, 0).
-        self.x_values = [0]
-        self.y_values = [0]
+        self.x_values = np.zeros(1, dtype=np.int64)
+        self.y_values = np.zeros(1, dtype=np.int64)
 
-    def fill_walk(self):
+    def fill_walk(self, chunk_size=CHUNK_SIZE):
         """Calculate all the points in the walk."""
-        
-        # Keep taking steps until the walk reaches the desired length.
-        while len(self.x_values) < self.num_points:
-            
-            # Decide which direction to go, and how far to go in that direction.
-            x_direction = choice([1, -1])
-            x_distance = choice([0, 1, 2, 3, 4])
-            x_step = x_direction * x_distance
-            
-            y_direction = choice([1, -1])
-            y_distance = choice([0, 1, 2, 3, 4])
-            y_step = y_direction * y_distance
-            
-            # Reject moves that go nowhere.
-            if x_step == 0 and y_step == 0:
-                continue
-            
-            # Calculate the next x and y values.
-            next_x = self.x_values[-1] + x_step
-            next_y = self.y_values[-1] + y_step
-            
-            self.x_values.append(next_x)
-            self.y_values.append(next_y)
-    
+        blocks = list(self.iter_blocks(chunk_size))
+        self.x_values = np.concatenate([x_values for x_values, y_values
+            in blocks])
+        self.y_values = np.concatenate([y_values for x_values, y_values
+            in blocks])
+
+    def iter_blocks(self, chunk_size=CHUNK_SIZE):
+        """
+        Yield the whole walk as (x_values, y_values) blocks, without
+          keeping it in memory. The first block is the points the walk
+          already has, usually just (0, 0); each block after that takes
+          up to chunk_size more steps from the end of the one before it.
+          Walks made with the same seed and chunk_size are identical.
+        """
+        yield self.x_values, self.y_values
+        x, y = self.x_values[-1], self.y_values[-1]
+        num_steps = self.num_points - len(self.x_values)
+        while num_steps > 0:
+            steps = self.get_steps(min(chunk_size, num_steps))
+            num_steps -= len(steps)
+
+            # Each point is the last point plus every step taken so far.
+            x_values = x + np.cumsum(steps[:, 0], dtype=np.int64)
+            y_values = y + np.cumsum(steps[:, 1], dtype=np.int64)
+            x, y = x_values[-1], y_values[-1]
+            yield x_values, y_values
+
+    def write_walk(self, path, chunk_size=CHUNK_SIZE):
+        """
+        Generate the walk straight into an int32 .npy file at path, one
+          block at a time, and return a WalkFile for reading it back.
+          Only one block is ever in memory, however long the walk is.
+        """
+        # Row 0 holds the x values and row 1 the y values, so each can be
+        #   read without touching the other. Mapping the file just writes
+        #   its header and sizes it.
+        points = np.lib.format.open_memmap(path, mode='w+', dtype=np.int32,
+            shape=(2, self.num_points))
+        x_offset = points.offset
+        y_offset = x_offset + points.strides[0]
+        del points
+
+        # Write each block with plain file writes, since pages written
+        #   through a memory map stay in this process's memory until it's
+        #   closed.
+        itemsize = np.dtype(np.int32).itemsize
+        start = 0
+        with open(path, 'r+b') as f_obj:
+            for x_values, y_values in self.iter_blocks(chunk_size):
+                f_obj.seek(x_offset + start * itemsize)
+                x_values.astype(np.int32).tofile(f_obj)
+                f_obj.seek(y_offset + start * itemsize)
+                y_values.astype(np.int32).tofile(f_obj)
+                start += len(x_values)
+        return WalkFile(path)
+
+    def get_steps(self, num_steps):
+        """Return num_steps (x, y) steps, none of which go nowhere."""
+        steps = self.draw_steps(num_steps)
+
+        # Reject moves that go nowhere, and draw those steps again until
+        #   none are left. Only the redrawn steps need checking each time.
+        stuck = np.flatnonzero((steps[:, 0] == 0) & (steps[:, 1] == 0))
+        while len(stuck):
+            new_steps = self.draw_steps(len(stuck))
+            steps[stuck] = new_steps
+            stuck = stuck[(new_steps[:, 0] == 0) & (new_steps[:, 1] == 0)]
+        return steps
+
+    def draw_steps(self, num_steps):
+        """
+        Return num_steps (x, y) steps as the rows of one array. Each step
+          picks a direction and a distance, for x and for y.
+        """
+        directions = 1 - 2 * self.rng.integers(0, 2, size=(num_steps, 2),
+            dtype=np.int8)
+        distances = self.rng.integers(0, 5, size=(num_steps, 2),
+            dtype=np.int8)
+        return directions * distances
+
+
+class WalkFile():
+    """
+    A walk saved by RandomWalk.write_walk(), read from disk only as its
+      points are used.
+    """
+
+    def __init__(self, path):
+        """Remember where the walk is; the file isn't opened until needed."""
+        self.path = path
+        self.points = None
+
+    def get_points(self):
+        """Return the walk as a read-only memory map of shape (2, n)."""
+        if self.points is None:
+            self.points = np.load(self.path, mmap_mode='r')
+        return self.points
+
+    @property
+    def num_points(self):
+        return self.get_points().shape[1]
+
+    @property
+    def x_values(self):
+        return self.get_points()[0]
+
+    @property
+    def y_values(self):
+        return self.get_points()[1]
+
+    def iter_blocks(self, chunk_size=CHUNK_SIZE):
+        """
+        Yield the walk as (x_values, y_values) blocks of chunk_size. The
+          blocks are read with plain file reads, so pages already passed
+          over don't stay mapped into this process's memory.
+        """
+        points = self.get_points()
+        x_offset = points.offset
+        y_offset = x_offset + points.strides[0]
+        dtype = points.dtype
+        with open(self.path, 'rb') as f_obj:
+            for start in range(0, self.num_points, chunk_size):
+                count = min(chunk_size, self.num_points - start)
+                f_obj.seek(x_offset + start * dtype.itemsize)
+                x_values = np.fromfile(f_obj, dtype=dtype, count=count)
+                f_obj.seek(y_offset + start * dtype.itemsize)
+                y_values = np.fromfile(f_obj, dtype=dtype, count=count)
+                yield x_values, y_values
+
+    def close(self):
+        """Let go of the memory map; it's reopened if used again."""
+        self.points = None
@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt
 
 from random_walk import RandomWalk
+from walk_raster import rasterize
 
 # Keep making new walks, as long as the program is active.
 while True:
@@ -11,9 +12,11 @@ while True:
     # Set the size of the plotting window.
     plt.figure(dpi=128, figsize=(10, 6))
     
-    point_numbers = list(range(rw.num_points))
-    plt.scatter(rw.x_values, rw.y_values, c=point_numbers, cmap=plt.cm.Blues,
-        edgecolor='none', s=1)
+    # Bin the points into one image, colored by when each pixel was first
+    #   reached, instead of drawing every point.
+    raster = rasterize(rw, width=500, height=300)
+    axes = plt.gca()
+    raster.draw(axes, cmap=plt.cm.Blues)
         
     # Emphasize the first and last points.
     plt.scatter(0, 0, c='green', edgecolors='none', s=100)
@@ -21,8 +24,8 @@ while True:
         s=100)
         
     # Remove the axes.
-    plt.axes().get_xaxis().set_visible(False)
-    plt.axes().get_yaxis().set_visible(False)
+    axes.get_xaxis().set_visible(False)
+    axes.get_yaxis().set_visible(False)
         
     plt.show()
     
@@ -0,0 +1,193 @@
+import argparse
+import os
+from collections import Counter
+from multiprocessing import Pool
+from time import perf_counter
+
+import numpy as np
+
+from random_walk import RandomWalk, CHUNK_SIZE
+
+class EnsembleStats():
+    """
+    Running sums over a set of walks of the same length. Every sum is an
+      integer or a count, so merging stats from different workers gives
+      exactly the same result in any order.
+    """
+
+    def __init__(self, num_points):
+        """
+        Start empty stats for walks of num_points points. A walk needs at
+          least 2 points to take a step.
+        """
+        if num_points < 2:
+            raise ValueError("Walks need at least 2 points, not {}.".format(
+                num_points))
+        self.num_points = num_points
+        self.num_walks = 0
+
+        # The sum over all walks of the squared distance from the start,
+        #   at each point of the walk.
+        self.squared_sums = np.zeros(num_points, dtype=np.int64)
+
+        # How many walks ended at each (x, y), and how many walks got
+        #   each squared distance as far as they ever got from the start.
+        self.end_points = Counter()
+        self.excursions = Counter()
+
+    def add_walk(self, walk, chunk_size=CHUNK_SIZE):
+        """Add one walk's points, one block at a time."""
+        start = 0
+        max_squared = 0
+        for x_values, y_values in walk.iter_blocks(chunk_size):
+            squared = x_values * x_values + y_values * y_values
+            end = start + len(squared)
+            self.squared_sums[start:end] += squared
+            max_squared = max(max_squared, int(squared.max()))
+            start = end
+
+        self.num_walks += 1
+        self.end_points[(int(x_values[-1]), int(y_values[-1]))] += 1
+        self.excursions[max_squared] += 1
+
+    def merge(self, other):
+        """Add the walks counted in other to these stats."""
+        self.num_walks += other.num_walks
+        self.squared_sums += other.squared_sums
+        self.end_points.update(other.end_points)
+        self.excursions.update(other.excursions)
+
+    def mean_squared_displacement(self):
+        """Return the mean squared distance from the start at each point."""
+        return self.squared_sums / max(self.num_walks, 1)
+
+    def end_point_arrays(self):
+        """Return the end points' x values, y values, and counts."""
+        points = sorted(self.end_points)
+        x_values = np.array([x for x, y in points], dtype=np.int64)
+        y_values = np.array([y for x, y in points], dtype=np.int64)
+        counts = np.array([self.end_points[point] for point in points],
+            dtype=np.int64)
+        return x_values, y_values, counts
+
+    def excursion_percentiles(self, percentiles):
+        """
+        Return the given percentiles of how far each walk got from the
+          start, by the nearest-rank method.
+        """
+        if not self.num_walks:
+            raise ValueError("There are no walks to take percentiles of.")
+        distances = sorted(self.excursions)
+        counts = np.cumsum([self.excursions[distance]
+            for distance in distances])
+        values = []
+        for percentile in percentiles:
+            rank = max(1, -(-self.num_walks * percentile // 100))
+            index = int(np.searchsorted(counts, rank))
+            values.append(distances[index] ** 0.5)
+        return values
+
+
+def run_batch(task):
+    """
+    Run one batch of walks on its own random stream, and return only
+      their stats.
+    """
+    seed_sequence, num_walks, num_points, chunk_size = task
+    rng = np.random.default_rng(seed_sequence)
+    stats = EnsembleStats(num_points)
+    for walk_number in range(num_walks):
+        # Walks in a batch share the batch's generator, one after another.
+        stats.add_walk(RandomWalk(num_points, seed=rng), chunk_size)
+    return stats
+
+def make_tasks(num_walks, num_points, batch_size, seed, chunk_size):
+    """
+    Split the walks into batches, each with its own seed spawned from
+      seed. Batches don't depend on the number of workers, so neither do
+      the results.
+    """
+    sizes = [min(batch_size, num_walks - start)
+        for start in range(0, num_walks, batch_size)]
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(sizes))
+    return [(seed_sequence, size, num_points, chunk_size)
+        for seed_sequence, size in zip(seed_sequences, sizes)]
+
+def run_ensemble(tasks, num_points, workers):
+    """
+    Run every batch on a pool of worker processes, merging each batch's
+      stats as it arrives. Return the merged stats, and the seconds taken.
+    """
+    start = perf_counter()
+    stats = EnsembleStats(num_points)
+    with Pool(workers) as pool:
+        for batch_stats in pool.imap_unordered(run_batch, tasks):
+            stats.merge(batch_stats)
+    return stats, perf_counter() - start
+
+def print_report(stats, seconds, workers):
+    """Print throughput, then the displacement, end points, and extremes."""
+    print("Ran {:,} walks of {:,} points on {} workers in {:.2f} s "
+        "({:,.0f} points/sec).".format(stats.num_walks, stats.num_points,
+        workers, seconds, stats.num_walks * stats.num_points / seconds))
+    if not stats.num_walks:
+        return
+
+    # A random walk's mean squared displacement grows in step with the
+    #   number of steps taken.
+    msd = stats.mean_squared_displacement()
+    print("\nMean squared displacement:")
+    print("       step           msd  per step")
+    steps = sorted(set(np.geomspace(1, stats.num_points - 1, 8).astype(int)))
+    for step in steps:
+        print("  {:>9,}  {:>12,.1f}  {:>8.3f}".format(step, msd[step],
+            msd[step] / step))
+
+    x_values, y_values, counts = stats.end_point_arrays()
+    distances = np.hypot(x_values, y_values)
+    print("\nEnd points:")
+    print("  mean x {:.2f}, mean y {:.2f}, mean distance {:.2f}".format(
+        np.average(x_values, weights=counts),
+        np.average(y_values, weights=counts),
+        np.average(distances, weights=counts)))
+    print("  {:,} different end points for {:,} walks".format(len(counts),
+        stats.num_walks))
+
+    print("\nFarthest distance from the start, per walk:")
+    percentiles = [50, 90, 99, 100]
+    print("  " + "  ".join("p{:<3} {:,.1f}".format(percentile, value)
+        for percentile, value in zip(percentiles,
+        stats.excursion_percentiles(percentiles))))
+
+def main():
+    """Run an ensemble of random walks from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Run many independent random walks on every core, and "
+            "report their ensemble statistics.")
+    parser.add_argument('--walks', type=int, default=1000,
+        help="number of walks to run")
+    parser.add_argument('--points', type=int, default=5000,
+        help="number of points in each walk")
+    parser.add_argument('--batch-size', type=int, default=50,
+        help="walks per batch; each batch has its own random stream")
+    parser.add_argument('--seed', type=int, default=1,
+        help="seed the batches' random streams are spawned from")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+        help="steps generated at a time within a walk")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+        help="number of worker processes")
+    args = parser.parse_args()
+    if args.walks < 1:
+        parser.error("--walks must be at least 1")
+    if args.points < 2:
+        parser.error("--points must be at least 2")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    tasks = make_tasks(args.walks, args.points, args.batch_size, args.seed,
+        args.chunk_size)
+    stats, seconds = run_ensemble(tasks, args.points, args.workers)
+    print_report(stats, seconds, args.workers)
+
+if __name__ == '__main__':
+    main()
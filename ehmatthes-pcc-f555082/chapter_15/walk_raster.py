@@ -0,0 +1,115 @@
+import numpy as np
+from matplotlib import pyplot as plt
+from matplotlib.colors import LogNorm
+
+from random_walk import CHUNK_SIZE
+
+# Marks pixels no point has landed in yet, in the first-step grid.
+NEVER = np.iinfo(np.int64).max
+
+class WalkRaster():
+    """
+    A walk's points binned into a fixed grid of pixels. Each pixel keeps
+      how many points landed in it, and the step that got there first.
+    """
+
+    def __init__(self, extent, width=1000, height=600):
+        """
+        Initialize an empty grid covering extent, a tuple of the x_min,
+          x_max, y_min, and y_max of the walk.
+        """
+        self.extent = extent
+        self.width = width
+        self.height = height
+        x_min, x_max, y_min, y_max = extent
+
+        # Map each value to a pixel in [0, width) or [0, height).
+        self.x_scale = width / (x_max - x_min + 1)
+        self.y_scale = height / (y_max - y_min + 1)
+
+        # The grids are kept flat while binning, one row after another.
+        self.counts = np.zeros(width * height, dtype=np.int64)
+        self.first_steps = np.full(width * height, NEVER, dtype=np.int64)
+        self.num_points = 0
+
+    def add_block(self, x_values, y_values):
+        """Bin the next block of the walk's points, in order."""
+        x_min, x_max, y_min, y_max = self.extent
+        columns = ((x_values - x_min) * self.x_scale).astype(np.int64)
+        rows = ((y_values - y_min) * self.y_scale).astype(np.int64)
+        np.clip(columns, 0, self.width - 1, out=columns)
+        np.clip(rows, 0, self.height - 1, out=rows)
+        pixels = rows * self.width + columns
+
+        self.counts += np.bincount(pixels, minlength=self.counts.size)
+
+        # Points come in step order, so the first time each pixel shows
+        #   up in this block is its earliest step here. Earlier blocks
+        #   win over later ones.
+        visited, first_indexes = np.unique(pixels, return_index=True)
+        self.first_steps[visited] = np.minimum(self.first_steps[visited],
+            self.num_points + first_indexes)
+        self.num_points += len(pixels)
+
+    def get_image(self, color_by='step'):
+        """
+        Return the grid as a masked 2D array for imshow(), holding either
+          each pixel's first step or its count. Empty pixels are masked.
+        """
+        if color_by == 'step':
+            values = self.first_steps
+        else:
+            values = self.counts
+        image = values.reshape(self.height, self.width)
+        return np.ma.masked_where(self.counts.reshape(image.shape) == 0,
+            image)
+
+    def draw(self, axes, color_by='step', cmap=plt.cm.Blues):
+        """
+        Draw the grid on axes as one image, in the walk's coordinates.
+          Color by the step that first reached each pixel, like coloring
+          each point by its number, or by how many points are in it.
+        """
+        x_min, x_max, y_min, y_max = self.extent
+        norm = None
+        if color_by == 'count':
+            norm = LogNorm()
+        return axes.imshow(self.get_image(color_by), cmap=cmap, norm=norm,
+            origin='lower', extent=(x_min, x_max + 1, y_min, y_max + 1),
+            aspect='auto', interpolation='nearest')
+
+
+def iter_chunks(walk, chunk_size=CHUNK_SIZE):
+    """
+    Yield a walk's points as (x_values, y_values) chunks of at most
+      chunk_size points. The walk can be a filled RandomWalk, or a
+      WalkFile, which is read from disk a chunk at a time.
+    """
+    # An unfilled RandomWalk would take new random steps on every pass.
+    if len(walk.x_values) < walk.num_points:
+        raise ValueError("Fill the walk, or write it to a file, first.")
+    for x_values, y_values in walk.iter_blocks(chunk_size):
+        for start in range(0, len(x_values), chunk_size):
+            yield (x_values[start:start + chunk_size],
+                y_values[start:start + chunk_size])
+
+def find_extent(walk, chunk_size=CHUNK_SIZE):
+    """Return the x_min, x_max, y_min, and y_max of a walk's points."""
+    x_min = y_min = NEVER
+    x_max = y_max = -NEVER
+    for x_values, y_values in iter_chunks(walk, chunk_size):
+        x_min = min(x_min, int(x_values.min()))
+        x_max = max(x_max, int(x_values.max()))
+        y_min = min(y_min, int(y_values.min()))
+        y_max = max(y_max, int(y_values.max()))
+    return x_min, x_max, y_min, y_max
+
+def rasterize(walk, width=1000, height=600, chunk_size=CHUNK_SIZE):
+    """
+    Bin every point of a walk into a width by height grid, one chunk at a
+      time, so memory depends on the grid size and not on the walk.
+    """
+    raster = WalkRaster(find_extent(walk, chunk_size), width, height)
+    for x_values, y_values in iter_chunks(walk, chunk_size):
+        raster.add_block(x_values, y_values)
+    return raster
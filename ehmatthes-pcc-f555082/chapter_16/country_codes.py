@@ -1,9 +1,121 @@
+import re
+import unicodedata
+from collections import Counter
+from difflib import get_close_matches
+from functools import lru_cache
+
 from pygal.i18n import COUNTRIES
 
+# Abbreviations the World Bank uses, and words that don't tell names apart.
+ABBREVIATIONS = {'rep': 'republic', 'dem': 'democratic', 'st': 'saint',
+    'fed': 'federated', 'sts': 'states'}
+IGNORED_WORDS = {'the', 'of', 'and'}
+
+# What follows the comma in World Bank names like 'Yemen, Rep.' when the
+#   part before the comma names the same country. Any other part after a
+#   comma, as in 'Sudan, South', can name a different country.
+QUALIFIERS = ['Rep.', 'Arab Rep.', 'Islamic Rep.', 'Dem. Rep.', 'The',
+    'Fed. Sts.', 'RB', 'FYR']
+
+# World Bank names too far from Pygal's to match any other way.
+ALIASES = {
+    'Hong Kong SAR, China': 'hk',
+    'Korea, Dem. Rep.': 'kp',
+    'Kyrgyz Republic': 'kg',
+    'Lao PDR': 'la',
+    'Libya': 'ly',
+    'Macao SAR, China': 'mo',
+    'Slovak Republic': 'sk',
+    'West Bank and Gaza': 'ps',
+    }
+
+# How close a name has to be to a known one to count as a misspelling.
+#   Lower than this, regions like South Asia start matching countries.
+FUZZY_CUTOFF = 0.9
+
+# How each lookup was answered: 'exact', 'alias', 'fuzzy', or 'miss'.
+lookup_counts = Counter()
+
+@lru_cache(maxsize=None)
+def normalize(name):
+    """
+    Return a name in lowercase ASCII words, with abbreviations spelled
+      out and punctuation and filler words dropped.
+    """
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore')
+    words = re.findall('[a-z0-9]+', name.decode().lower().replace("'", ''))
+    return ' '.join(ABBREVIATIONS.get(word, word) for word in words
+        if word not in IGNORED_WORDS)
+
+def build_indexes(countries, aliases):
+    """
+    Return a dict of codes by normalized country name, and a dict of
+      codes by normalized alias. Names like 'Bolivia, Plurinational State
+      of' also get an alias for the part before the comma, as long as no
+      other country shares it.
+    """
+    names = {normalize(name): code for code, name in countries.items()}
+
+    short_names = Counter(normalize(name.split(',')[0])
+        for name in countries.values() if ',' in name)
+    other_names = {}
+    for code, name in countries.items():
+        short_name = normalize(name.split(',')[0])
+        if (',' in name and short_names[short_name] == 1 and
+                short_name not in names):
+            other_names[short_name] = code
+    for alias, code in aliases.items():
+        other_names[normalize(alias)] = code
+    return names, other_names
+
+CODES_BY_NAME, CODES_BY_ALIAS = build_indexes(COUNTRIES, ALIASES)
+KNOWN_QUALIFIERS = {normalize(qualifier) for qualifier in QUALIFIERS}
+
+@lru_cache(maxsize=None)
+def fuzzy_code(normalized_name):
+    """Return the code of the closest known name, or None if none is close."""
+    matches = get_close_matches(normalized_name, CODES_BY_NAME, 1,
+        FUZZY_CUTOFF)
+    if matches:
+        return CODES_BY_NAME[matches[0]]
+    return None
+
 def get_country_code(country_name):
     """Return the Pygal 2-digit country code for the given country."""
-    for code, name in COUNTRIES.items():
-        if name == country_name:
-            return code
+    name = normalize(country_name)
+    if name in CODES_BY_NAME:
+        lookup_counts['exact'] += 1
+        return CODES_BY_NAME[name]
+
+    # World Bank names like 'Yemen, Rep.' often match on the first part,
+    #   but only a known qualifier says it's the same country.
+    short_name, comma, qualifier = country_name.partition(',')
+    short_name = normalize(short_name)
+    if not comma or normalize(qualifier) not in KNOWN_QUALIFIERS:
+        short_name = None
+    for key in (name, short_name):
+        if key in CODES_BY_ALIAS:
+            lookup_counts['alias'] += 1
+            return CODES_BY_ALIAS[key]
+    if short_name in CODES_BY_NAME:
+        lookup_counts['alias'] += 1
+        return CODES_BY_NAME[short_name]
+
+    code = fuzzy_code(name)
+    if code:
+        lookup_counts['fuzzy'] += 1
+        return code
+
     # If the country wasn't found, return None.
+    lookup_counts['miss'] += 1
     return None
+
+def lookup_stats():
+    """
+    Return how many lookups were answered each way, and how many fuzzy
+      matches came from the cache.
+    """
+    stats = {kind: lookup_counts[kind]
+        for kind in ('exact', 'alias', 'fuzzy', 'miss')}
+    stats['fuzzy cache hits'] = fuzzy_code.cache_info().hits
+    return stats
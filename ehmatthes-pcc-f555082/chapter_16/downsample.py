@@ -0,0 +1,99 @@
+from datetime import date
+
+import numpy as np
+
+def as_numbers(x_values):
+    """
+    Return x values as floats. Dates and datetimes become seconds since
+      the first one.
+    """
+    if len(x_values) and isinstance(x_values[0], date):
+        first = x_values[0]
+        return np.fromiter(((value - first).total_seconds()
+            for value in x_values), float, len(x_values))
+    x_values = np.asarray(x_values)
+    if np.issubdtype(x_values.dtype, np.datetime64):
+        x_values = x_values.astype('datetime64[s]').astype(np.int64)
+    return x_values.astype(float)
+
+def min_max(y_values, num_buckets):
+    """
+    Return the indexes of the lowest and highest point in each of about
+      num_buckets equal runs of points, in order. Every extreme of the
+      series is kept, which is what a chart shows most.
+    """
+    y_values = np.asarray(y_values, dtype=float)
+    num_points = len(y_values)
+    if 2 * num_buckets >= num_points:
+        return np.arange(num_points)
+
+    # Pad the last run to full length, with values that never win.
+    bucket_size = -(-num_points // num_buckets)
+    num_buckets = -(-num_points // bucket_size)
+    padding = num_buckets * bucket_size - num_points
+    starts = np.arange(num_buckets) * bucket_size
+    lows = np.append(y_values, np.full(padding, np.inf))
+    highs = np.append(y_values, np.full(padding, -np.inf))
+    low_indexes = starts + lows.reshape(num_buckets, -1).argmin(axis=1)
+    high_indexes = starts + highs.reshape(num_buckets, -1).argmax(axis=1)
+    return np.unique(np.concatenate([low_indexes, high_indexes]))
+
+def lttb(x_values, y_values, num_points):
+    """
+    Return the indexes of num_points points that keep the series' shape,
+      by Largest-Triangle-Three-Buckets. The first and last points are
+      always kept. In each bucket between them, the point that makes the
+      largest triangle with the last point kept and the average of the
+      next bucket is kept.
+    """
+    x_values = as_numbers(x_values)
+    y_values = np.asarray(y_values, dtype=float)
+    n = len(y_values)
+    if num_points >= n or num_points < 3:
+        return np.arange(n)
+
+    # The points between the first and last, split into equal buckets,
+    #   and the average point of each bucket. The last point counts as
+    #   one more bucket, for the last bucket to look ahead to.
+    edges = np.linspace(1, n - 1, num_points - 1).astype(int)
+    sizes = np.append(np.diff(edges), 1)
+    starts = np.append(edges[:-1], n - 1)
+    average_x = np.add.reduceat(x_values, starts) / sizes
+    average_y = np.add.reduceat(y_values, starts) / sizes
+
+    indexes = np.empty(num_points, dtype=np.int64)
+    indexes[0], indexes[-1] = 0, n - 1
+    kept = 0
+    for bucket in range(num_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        x, y = x_values[start:end], y_values[start:end]
+        areas = np.abs((x_values[kept] - average_x[bucket + 1]) *
+            (y - y_values[kept]) - (x_values[kept] - x) *
+            (average_y[bucket + 1] - y_values[kept]))
+        kept = start + int(areas.argmax())
+        indexes[bucket + 1] = kept
+    return indexes
+
+def downsample(x_values, series, num_points, method='min_max'):
+    """
+    Return the indexes to keep from x_values and each of the series, so
+      a chart gets about num_points points per series instead of all of
+      them. Every series keeps the same x values, so two series can still
+      be filled between.
+    """
+    if method == 'lttb':
+        x_values = as_numbers(x_values)
+        kept = [lttb(x_values, y_values, num_points) for y_values in series]
+    else:
+        kept = [min_max(y_values, num_points // 2) for y_values in series]
+    return np.unique(np.concatenate(kept))
+
+def take(values, indexes):
+    """Return the values at indexes, as an array or a list like values."""
+    if isinstance(values, np.ndarray):
+        return values[indexes]
+    return [values[index] for index in indexes.tolist()]
+
+def chart_width(fig):
+    """Return how many pixels wide a matplotlib figure is drawn."""
+    return int(fig.get_figwidth() * fig.dpi)
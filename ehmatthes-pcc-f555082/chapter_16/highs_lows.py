@@ -1,29 +1,23 @@
-import csv
-from datetime import datetime
-
 from matplotlib import pyplot as plt
 
+from downsample import downsample, chart_width
+from weather_data import load_weather
+
 # Get dates, high, and low temperatures from file.
 filename = 'death_valley_2014.csv'
-with open(filename) as f:
-    reader = csv.reader(f)
-    header_row = next(reader)
-
-    dates, highs, lows = [], [], []
-    for row in reader:
-        try:
-            current_date = datetime.strptime(row[0], "%Y-%m-%d")
-            high = int(row[1])
-            low = int(row[3])
-        except ValueError:
-            print(current_date, 'missing data')
-        else:
-            dates.append(current_date)
-            highs.append(high)
-            lows.append(low)
+weather = load_weather(filename)
+columns = ['Max TemperatureF', 'Min TemperatureF']
+for bad_date in weather.bad_dates:
+    print(repr(bad_date), 'is not a date, skipping row')
+for missing_date in weather.dates[weather.missing(*columns)]:
+    print(missing_date, 'missing data')
+series = weather.series(*columns).period('2014')
 
-# Plot data.
+# Plot data, cut down to about one point per pixel across the chart.
 fig = plt.figure(dpi=128, figsize=(10, 6))
+series = series.take(downsample(series.dates,
+    [series[name] for name in columns], chart_width(fig)))
+dates, highs, lows = series.dates, series[columns[0]], series[columns[1]]
 plt.plot(dates, highs, c='red', alpha=0.5)
 plt.plot(dates, lows, c='blue', alpha=0.5)
 plt.fill_between(dates, highs, lows, facecolor='blue', alpha=0.1)
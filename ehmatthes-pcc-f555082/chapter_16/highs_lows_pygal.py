@@ -0,0 +1,26 @@
+import pygal
+
+from downsample import downsample
+from weather_data import load_weather
+
+# Get dates, high, and low temperatures from file.
+filename = 'death_valley_2014.csv'
+weather = load_weather(filename)
+columns = ['Max TemperatureF', 'Min TemperatureF']
+for bad_date in weather.bad_dates:
+    print(repr(bad_date), 'is not a date, skipping row')
+for missing_date in weather.dates[weather.missing(*columns)]:
+    print(missing_date, 'missing data')
+series = weather.series(*columns).period('2014')
+
+# Make the chart, and cut the data down to the points its width can show.
+chart = pygal.DateTimeLine(x_label_rotation=20, show_dots=False)
+series = series.take(downsample(series.dates,
+    [series[name] for name in columns], chart.config.width, method='lttb'))
+dates, highs, lows = series.dates, series[columns[0]], series[columns[1]]
+
+chart.title = "Daily high and low temperatures - 2014, Death Valley, CA"
+chart.y_title = "Temperature (F)"
+chart.add('High', list(zip(dates.tolist(), highs.tolist())))
+chart.add('Low', list(zip(dates.tolist(), lows.tolist())))
+chart.render_to_file('highs_lows.svg')
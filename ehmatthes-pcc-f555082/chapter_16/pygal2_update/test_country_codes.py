@@ -0,0 +1,19 @@
+import unittest
+
+from country_codes import get_country_code
+
+class CountryCodesTestCase(unittest.TestCase):
+    """Tests for 'country_codes.py'."""
+
+    def test_qualified_name(self):
+        """Test that a known qualifier matches on the name before it."""
+        self.assertEqual(get_country_code('Yemen, Rep.'), 'ye')
+        self.assertEqual(get_country_code('Egypt, Arab Rep.'), 'eg')
+
+    def test_other_country_after_comma(self):
+        """Test that 'Sudan, South' isn't looked up as Sudan."""
+        self.assertEqual(get_country_code('Sudan'), 'sd')
+        self.assertNotEqual(get_country_code('Sudan, South'), 'sd')
+
+
+unittest.main()
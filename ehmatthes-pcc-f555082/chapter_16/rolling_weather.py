@@ -0,0 +1,265 @@
+import argparse
+import csv
+from collections import deque
+from datetime import date
+from math import isfinite, sqrt
+from time import sleep
+
+HIGH = 'Max TemperatureF'
+LOW = 'Min TemperatureF'
+
+class RollingWindow():
+    """
+    The mean, spread, lowest, and highest of the values from the last few
+      days. Each value is added and dropped once, so the cost per value
+      stays the same however long the feed runs.
+    """
+
+    def __init__(self, days):
+        """Start an empty window covering this many days."""
+        self.days = days
+
+        # Every (day, value) in the window, and their sum and sum of
+        #   squares for the mean and standard deviation.
+        self.values = deque()
+        self.total = 0
+        self.total_squares = 0
+
+        # Candidates for the lowest and highest value, in day order. Each
+        #   deque only keeps values that could still become the extreme
+        #   once everything older has left the window.
+        self.lows = deque()
+        self.highs = deque()
+
+    def add(self, day, value):
+        """Add the value for day, a date's ordinal, to the window."""
+        self.expire(day)
+        self.values.append((day, value))
+        self.total += value
+        self.total_squares += value * value
+
+        while self.lows and self.lows[-1][1] >= value:
+            self.lows.pop()
+        self.lows.append((day, value))
+        while self.highs and self.highs[-1][1] <= value:
+            self.highs.pop()
+        self.highs.append((day, value))
+
+    def expire(self, day):
+        """Drop values too old to be in the window as of day."""
+        oldest = day - self.days + 1
+        while self.values and self.values[0][0] < oldest:
+            old_day, value = self.values.popleft()
+            self.total -= value
+            self.total_squares -= value * value
+        while self.lows and self.lows[0][0] < oldest:
+            self.lows.popleft()
+        while self.highs and self.highs[0][0] < oldest:
+            self.highs.popleft()
+
+    def __len__(self):
+        return len(self.values)
+
+    def mean(self):
+        return self.total / len(self.values)
+
+    def std(self):
+        """Return the population standard deviation of the window."""
+        mean = self.mean()
+        return sqrt(max(self.total_squares / len(self.values) - mean * mean,
+            0.0))
+
+    def low(self):
+        return self.lows[0][1]
+
+    def high(self):
+        return self.highs[0][1]
+
+
+class WeatherFeed():
+    """
+    Follow a station's rows as they arrive, keeping rolling statistics,
+      records, and flags for unusual values in a few columns.
+    """
+
+    def __init__(self, header_row, columns=(HIGH, LOW), windows=(7, 30),
+            threshold=3.0):
+        """
+        Prepare to read rows laid out like header_row. A value is flagged
+          when it's more than threshold standard deviations from the mean
+          of one of its windows.
+        """
+        names = [name.strip() for name in header_row]
+        self.indexes = {column: names.index(column) for column in columns}
+        self.threshold = threshold
+        self.rows = 0
+        self.skipped = 0
+        self.last_date = None
+
+        # Windows for each column, and each column's (value, date) records.
+        self.windows = {column: [RollingWindow(days) for days in windows]
+            for column in columns}
+        self.record_highs = {column: None for column in columns}
+        self.record_lows = {column: None for column in columns}
+
+    def add_row(self, row):
+        """
+        Update everything from one CSV row. Return a list of flags, each a
+          dict describing a new record or an unusual value. Blank rows,
+          rows without a date, and rows dated on or before the last row
+          are skipped.
+        """
+        try:
+            year, month, day = row[0].split('-')
+            current_date = date(int(year), int(month), int(day))
+        except (ValueError, IndexError):
+            return []
+
+        # The windows expect days in order, so a row that goes back in time
+        #   or repeats a day can't be added to them.
+        if self.last_date is not None and current_date <= self.last_date:
+            self.skipped += 1
+            return []
+        self.rows += 1
+        self.last_date = current_date
+        ordinal = current_date.toordinal()
+
+        flags = []
+        for column, index in self.indexes.items():
+            value = parse_value(row[index]) if index < len(row) else None
+            if value is None:
+                # A missing value; the windows only move on with real ones.
+                continue
+            flags.extend(self.check_value(column, current_date, ordinal,
+                value))
+        return flags
+
+    def check_value(self, column, current_date, ordinal, value):
+        """Flag a column's new value, then add it to its windows."""
+        flags = []
+        record_high = self.record_highs[column]
+        if record_high is None or value > record_high[0]:
+            if record_high is not None:
+                flags.append({'date': current_date, 'column': column,
+                    'kind': 'record high', 'value': value,
+                    'previous': record_high[0]})
+            self.record_highs[column] = (value, current_date)
+        record_low = self.record_lows[column]
+        if record_low is None or value < record_low[0]:
+            if record_low is not None:
+                flags.append({'date': current_date, 'column': column,
+                    'kind': 'record low', 'value': value,
+                    'previous': record_low[0]})
+            self.record_lows[column] = (value, current_date)
+
+        for window in self.windows[column]:
+            # Compare against the window as it stood before this value,
+            #   once it holds enough days to say what's usual.
+            window.expire(ordinal)
+            if len(window) >= max(3, window.days // 2):
+                mean, std = window.mean(), window.std()
+                if std and abs(value - mean) > self.threshold * std:
+                    flags.append({'date': current_date, 'column': column,
+                        'kind': 'unusual over {} days'.format(window.days),
+                        'value': value, 'mean': mean, 'std': std})
+            window.add(ordinal, value)
+        return flags
+
+    def summary(self):
+        """Return lines describing the current windows and records."""
+        lines = ["{:,} rows, through {}.".format(self.rows, self.last_date)]
+        if self.skipped:
+            lines.append("Skipped {:,} rows dated out of order.".format(
+                self.skipped))
+        for column, windows in self.windows.items():
+            lines.append("{}: record high {}, record low {}".format(column,
+                format_record(self.record_highs[column]),
+                format_record(self.record_lows[column])))
+            for window in windows:
+                if not len(window):
+                    continue
+                lines.append("  last {:>3} days: mean {:.1f}, std {:.1f}, "
+                    "low {}, high {}".format(window.days, window.mean(),
+                    window.std(), window.low(), window.high()))
+        return lines
+
+
+def parse_value(text):
+    """
+    Return a cell's number, an int if it's whole and a float if not, or
+      None if the cell is blank or isn't a number.
+    """
+    try:
+        value = float(text)
+    except ValueError:
+        return None
+    if not isfinite(value):
+        return None
+    return int(value) if value.is_integer() else value
+
+def format_record(record):
+    """Return a (value, date) record as text."""
+    if record is None:
+        return "none"
+    return "{} on {}".format(*record)
+
+def follow_lines(f_obj, follow=True, poll_seconds=1.0):
+    """
+    Yield each whole line of an open file. At the end of the file, wait
+      for more lines to be written if follow is True, like tail -f.
+    """
+    partial = ''
+    while True:
+        line = f_obj.readline()
+        if line:
+            # A line without its newline is still being written.
+            partial += line
+            if partial.endswith('\n'):
+                yield partial
+                partial = ''
+        elif follow:
+            sleep(poll_seconds)
+        else:
+            if partial:
+                yield partial
+            return
+
+def print_flag(flag):
+    """Print one flag from WeatherFeed.add_row()."""
+    if 'mean' in flag:
+        detail = "mean {:.1f}, std {:.1f}".format(flag['mean'], flag['std'])
+    else:
+        detail = "previous {}".format(flag['previous'])
+    print("{}  {:<18} {:<28} {:>4}  ({})".format(flag['date'],
+        flag['column'], flag['kind'], flag['value'], detail))
+
+def main():
+    """Follow a weather CSV from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Read a weather station CSV row by row, flagging "
+            "records and unusual values as they arrive.")
+    parser.add_argument('filename', help="a CSV laid out like "
+        "sitka_weather_2014.csv")
+    parser.add_argument('--window', type=int, action='append',
+        help="days in a rolling window; give it more than once for more "
+            "windows (default 7 and 30)")
+    parser.add_argument('--threshold', type=float, default=3.0,
+        help="standard deviations from the mean that count as unusual")
+    parser.add_argument('--follow', action='store_true',
+        help="keep waiting for new rows at the end of the file")
+    args = parser.parse_args()
+
+    with open(args.filename, newline='') as f_obj:
+        reader = csv.reader(follow_lines(f_obj, args.follow))
+        feed = WeatherFeed(next(reader), windows=args.window or [7, 30],
+            threshold=args.threshold)
+        try:
+            for row in reader:
+                for flag in feed.add_row(row):
+                    print_flag(flag)
+        except KeyboardInterrupt:
+            pass
+    print("\n" + "\n".join(feed.summary()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,335 @@
+import argparse
+import glob
+import os
+from multiprocessing import Pool
+from time import perf_counter
+
+import numpy as np
+
+from weather_data import load_weather
+
+HIGH = 'Max TemperatureF'
+LOW = 'Min TemperatureF'
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug',
+    'Sep', 'Oct', 'Nov', 'Dec']
+
+def missing_high(dtype):
+    """Return the stand-in for a day without a high, in an array of dtype."""
+    if np.issubdtype(dtype, np.integer):
+        return np.iinfo(dtype).min
+    return -np.inf
+
+def missing_low(dtype):
+    """Return the stand-in for a day without a low, in an array of dtype."""
+    if np.issubdtype(dtype, np.integer):
+        return np.iinfo(dtype).max
+    return np.inf
+
+def widen(values, dtype, missing):
+    """
+    Return values as dtype, with the days that were missing(values.dtype)
+      changed to missing(dtype).
+    """
+    if values.dtype == dtype:
+        return values
+    widened = values.astype(dtype)
+    if missing:
+        widened[values == missing(values.dtype)] = missing(dtype)
+    return widened
+
+class WeatherSummary():
+    """
+    Running aggregates over any number of stations. Every part is a max,
+      a min, a sum, or a count, so summaries made in different processes
+      merge into exactly the same result in any order.
+    """
+
+    def __init__(self):
+        """Start an empty summary."""
+        # Each station's own figures, by station name.
+        self.stations = {}
+
+        # The highest high and lowest low of any station on each day,
+        #   for the days from first_day on. Every accumulator starts out
+        #   as int64, and becomes float64 once a station has fractional
+        #   temperatures.
+        self.first_day = 0
+        self.day_highs = np.zeros(0, dtype=np.int64)
+        self.day_lows = np.zeros(0, dtype=np.int64)
+
+        # Sums and counts of highs and lows in each month, for the months
+        #   from first_month on.
+        self.first_month = 0
+        self.month_sums = np.zeros((0, 2), dtype=np.int64)
+        self.month_counts = np.zeros((0, 2), dtype=np.int64)
+
+        # The records: (temperature, date, station), or None.
+        self.record_high = None
+        self.record_low = None
+
+    def add_station(self, name, weather):
+        """Add one station's WeatherData to the summary."""
+        dates, highs, lows = weather.valid_rows(HIGH, LOW)
+
+        # Whole-number temperatures are summed exactly as int64; any others
+        #   as float64, leaving out values that aren't finite.
+        dtype = np.result_type(highs, lows, np.int64)
+        if not np.issubdtype(dtype, np.integer):
+            dtype = np.dtype(np.float64)
+            highs, lows = highs.astype(dtype), lows.astype(dtype)
+            finite = np.isfinite(highs) & np.isfinite(lows)
+            dates, highs, lows = dates[finite], highs[finite], lows[finite]
+        if not len(dates):
+            self.stations[name] = {'days': 0}
+            return
+
+        # Extremes for each day; a station has at most one row per day.
+        days = dates.astype(np.int64)
+        first_day = int(days.min())
+        day_highs = np.full(int(days.max()) - first_day + 1,
+            missing_high(dtype), dtype=dtype)
+        day_lows = np.full(len(day_highs), missing_low(dtype), dtype=dtype)
+        np.maximum.at(day_highs, days - first_day, highs)
+        np.minimum.at(day_lows, days - first_day, lows)
+        self.merge_days(first_day, day_highs, day_lows)
+
+        # Sums and counts for each month.
+        months = dates.astype('datetime64[M]').astype(np.int64)
+        first_month = int(months.min())
+        num_months = int(months.max()) - first_month + 1
+        month_sums = np.stack([
+            np.bincount(months - first_month, highs, num_months),
+            np.bincount(months - first_month, lows, num_months)],
+            axis=1).astype(dtype)
+        counts = np.bincount(months - first_month, minlength=num_months)
+        month_counts = np.stack([counts, counts], axis=1)
+        self.merge_months(first_month, month_sums, month_counts)
+
+        high_index, low_index = int(highs.argmax()), int(lows.argmin())
+        record_high = (highs[high_index].item(), str(dates[high_index]),
+            name)
+        record_low = (lows[low_index].item(), str(dates[low_index]), name)
+        self.merge_records(record_high, record_low)
+
+        self.stations[name] = {
+            'days': len(dates),
+            'first': str(dates[0]),
+            'last': str(dates[-1]),
+            'high_sum': highs.sum().item(),
+            'low_sum': lows.sum().item(),
+            'record_high': record_high,
+            'record_low': record_low,
+            }
+
+    def merge(self, other):
+        """Add everything in another summary to this one."""
+        self.stations.update(other.stations)
+        self.merge_days(other.first_day, other.day_highs, other.day_lows)
+        self.merge_months(other.first_month, other.month_sums,
+            other.month_counts)
+        self.merge_records(other.record_high, other.record_low)
+
+    def merge_days(self, first_day, day_highs, day_lows):
+        """Combine another run of daily extremes with this one's."""
+        dtype = np.result_type(self.day_highs, day_highs)
+        first, highs, other_highs = align(self.first_day,
+            widen(self.day_highs, dtype, missing_high), first_day,
+            widen(day_highs, dtype, missing_high), missing_high(dtype))
+        first, lows, other_lows = align(self.first_day,
+            widen(self.day_lows, dtype, missing_low), first_day,
+            widen(day_lows, dtype, missing_low), missing_low(dtype))
+        self.first_day = first
+        self.day_highs = np.maximum(highs, other_highs)
+        self.day_lows = np.minimum(lows, other_lows)
+
+    def merge_months(self, first_month, month_sums, month_counts):
+        """Add another run of monthly sums and counts to this one's."""
+        dtype = np.result_type(self.month_sums, month_sums)
+        first, sums, other_sums = align(self.first_month,
+            widen(self.month_sums, dtype, None), first_month,
+            widen(month_sums, dtype, None), 0)
+        first, counts, other_counts = align(self.first_month,
+            self.month_counts, first_month, month_counts, 0)
+        self.first_month = first
+        self.month_sums = sums + other_sums
+        self.month_counts = counts + other_counts
+
+    def merge_records(self, record_high, record_low):
+        """
+        Keep the more extreme of each record. Ties go to the earlier date,
+          then to the station that sorts first, so any order of merging
+          ends with the same records.
+        """
+        if record_high and (not self.record_high or
+                (-record_high[0], record_high[1:]) <
+                (-self.record_high[0], self.record_high[1:])):
+            self.record_high = record_high
+        if record_low and (not self.record_low or
+                record_low < self.record_low):
+            self.record_low = record_low
+
+    def monthly_means(self):
+        """
+        Return each month's first day, and its mean high and low, for
+          the months with data.
+        """
+        has_data = self.month_counts[:, 0] > 0
+        months = (self.first_month + np.flatnonzero(has_data)).astype(
+            'datetime64[M]')
+        means = self.month_sums[has_data] / self.month_counts[has_data]
+        return months, means[:, 0], means[:, 1]
+
+    def calendar_means(self):
+        """Return the mean high and low in each calendar month, Jan first."""
+        calendar_months = (self.first_month +
+            np.arange(len(self.month_sums))) % 12
+        sums = np.zeros((12, 2), dtype=self.month_sums.dtype)
+        counts = np.zeros((12, 2), dtype=np.int64)
+        np.add.at(sums, calendar_months, self.month_sums)
+        np.add.at(counts, calendar_months, self.month_counts)
+        return sums / np.maximum(counts, 1)
+
+    def daily_extremes(self):
+        """
+        Return the dates with data, and the highest high and lowest low
+          of any station on each.
+        """
+        has_data = self.day_highs != missing_high(self.day_highs.dtype)
+        dates = (self.first_day + np.flatnonzero(has_data)).astype(
+            'datetime64[D]')
+        return dates, self.day_highs[has_data], self.day_lows[has_data]
+
+
+def align(first_a, values_a, first_b, values_b, fill):
+    """
+    Return a common first index, and both runs of values padded with
+      fill so they cover the same indexes.
+    """
+    if not len(values_a):
+        return first_b, np.full_like(values_b, fill), values_b
+    if not len(values_b):
+        return first_a, values_a, np.full_like(values_a, fill)
+    first = min(first_a, first_b)
+    last = max(first_a + len(values_a), first_b + len(values_b))
+    padded = []
+    for start, values in [(first_a, values_a), (first_b, values_b)]:
+        if start == first and len(values) == last - first:
+            padded.append(values)
+            continue
+        new_values = np.full((last - first,) + values.shape[1:], fill,
+            dtype=values.dtype)
+        new_values[start - first:start - first + len(values)] = values
+        padded.append(new_values)
+    return first, padded[0], padded[1]
+
+def summarize_file(task):
+    """Load one station's CSV, and return a summary of just that station."""
+    filename, name, use_cache = task
+    summary = WeatherSummary()
+    summary.add_station(name, load_weather(filename, use_cache))
+    return summary
+
+def station_names(filenames):
+    """
+    Return a name for each file: its path from the folder all the files
+      are in, without the extension, so files with the same name in
+      different folders stay apart.
+    """
+    paths = [os.path.abspath(filename) for filename in filenames]
+    root = os.path.commonpath(paths)
+    if len(paths) == 1:
+        root = os.path.dirname(root)
+    return [os.path.splitext(os.path.relpath(path, root))[0]
+        for path in paths]
+
+def find_files(paths):
+    """Return the CSV files named by paths, which are folders or globs."""
+    filenames = set()
+    for path in paths:
+        if os.path.isdir(path):
+            path = os.path.join(path, '*.csv')
+        filenames.update(glob.glob(path))
+    return sorted(filenames)
+
+def summarize_files(filenames, workers, use_cache=True):
+    """
+    Summarize every file on a pool of worker processes, merging each
+      station's summary as it arrives. Return the merged summary, and the
+      seconds taken.
+    """
+    start = perf_counter()
+    summary = WeatherSummary()
+    tasks = [(filename, name, use_cache)
+        for filename, name in zip(filenames, station_names(filenames))]
+    with Pool(workers) as pool:
+        chunksize = max(1, len(tasks) // (workers * 8))
+        for station_summary in pool.imap_unordered(summarize_file, tasks,
+                chunksize):
+            summary.merge(station_summary)
+    return summary, perf_counter() - start
+
+def print_report(summary, seconds, workers):
+    """Print throughput, each station, then the cross-station figures."""
+    stations = summary.stations
+    total_days = sum(station['days'] for station in stations.values())
+    print("Read {:,} stations ({:,} station-days) on {} workers in {:.2f} s "
+        "({:,.0f} days/sec).".format(len(stations), total_days, workers,
+        seconds, total_days / seconds))
+
+    print("\n  station                   first        last       days  "
+        "mean high  mean low  record high  record low")
+    for name, station in sorted(stations.items()):
+        if not station['days']:
+            print("  {:<22}  no data".format(name))
+            continue
+        print("  {:<22}  {}  {}  {:>7,}  {:>9.1f}  {:>8.1f}  {:>11}  "
+            "{:>10}".format(name, station['first'], station['last'],
+            station['days'], station['high_sum'] / station['days'],
+            station['low_sum'] / station['days'],
+            station['record_high'][0], station['record_low'][0]))
+    if not summary.record_high:
+        return
+
+    print("\nRecord high: {} F on {} at {}.".format(*summary.record_high))
+    print("Record low: {} F on {} at {}.".format(*summary.record_low))
+
+    print("\nMean high and low by calendar month, over every station-year:")
+    for month_name, (high, low) in zip(MONTH_NAMES,
+            summary.calendar_means()):
+        print("  {}  {:>6.1f}  {:>6.1f}".format(month_name, high, low))
+
+    months, highs, lows = summary.monthly_means()
+    hottest = int(highs.argmax())
+    coldest = int(lows.argmin())
+    print("\nHottest month: {}, mean high {:.1f} F.".format(months[hottest],
+        highs[hottest]))
+    print("Coldest month: {}, mean low {:.1f} F.".format(months[coldest],
+        lows[coldest]))
+
+    dates, day_highs, day_lows = summary.daily_extremes()
+    print("Days with data at any station: {:,}, from {} to {}.".format(
+        len(dates), dates[0], dates[-1]))
+
+def main():
+    """Summarize many stations' weather files from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Read many weather station CSVs on every core, and "
+            "report per-station and cross-station aggregates.")
+    parser.add_argument('paths', nargs='*', default=['sitka_weather_*.csv'],
+        help="folders of CSV files, or glob patterns")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+        help="number of worker processes")
+    parser.add_argument('--no-cache', action='store_true',
+        help="parse every CSV, ignoring and not writing the binary caches")
+    args = parser.parse_args()
+
+    filenames = find_files(args.paths)
+    if not filenames:
+        parser.error("no CSV files found")
+    summary, seconds = summarize_files(filenames, args.workers,
+        not args.no_cache)
+    print_report(summary, seconds, args.workers)
+
+if __name__ == '__main__':
+    main()
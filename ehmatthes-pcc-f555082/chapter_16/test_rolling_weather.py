@@ -0,0 +1,45 @@
+import unittest
+from datetime import date
+
+from rolling_weather import HIGH, LOW, WeatherFeed, parse_value
+
+class WeatherFeedTestCase(unittest.TestCase):
+    """Tests for the WeatherFeed class in 'rolling_weather.py'."""
+
+    def setUp(self):
+        """Create a feed with one 7-day window for each column."""
+        self.feed = WeatherFeed(['Date', HIGH, LOW], windows=(7,))
+
+    def test_fractional_value(self):
+        """Test that a fractional reading is kept, not treated as missing."""
+        self.feed.add_row(['2014-7-1', '57.5', '50'])
+        window = self.feed.windows[HIGH][0]
+        self.assertEqual(len(window), 1)
+        self.assertEqual(window.high(), 57.5)
+        self.assertEqual(self.feed.record_highs[HIGH],
+            (57.5, date(2014, 7, 1)))
+
+    def test_whole_value_stays_int(self):
+        """Test that whole readings still come out as ints."""
+        self.assertEqual(parse_value('57'), 57)
+        self.assertIsInstance(parse_value('57.0'), int)
+
+    def test_missing_value(self):
+        """Test that only blank or missing cells are skipped."""
+        self.feed.add_row(['2014-7-1', '', '50'])
+        self.feed.add_row(['2014-7-2', '61'])
+        self.assertEqual(len(self.feed.windows[HIGH][0]), 1)
+        self.assertEqual(len(self.feed.windows[LOW][0]), 1)
+
+    def test_out_of_order_rows(self):
+        """Test that blank rows and rows going back in time are skipped."""
+        self.feed.add_row(['2014-7-2', '60', '50'])
+        self.feed.add_row([])
+        self.feed.add_row(['2014-7-1', '70', '40'])
+        self.feed.add_row(['2014-7-2', '70', '40'])
+        self.assertEqual(self.feed.rows, 1)
+        self.assertEqual(self.feed.skipped, 2)
+        self.assertEqual(self.feed.windows[HIGH][0].high(), 60)
+
+
+unittest.main()
@@ -0,0 +1,167 @@
+from functools import reduce
+
+import numpy as np
+
+# How resample() combines the values in each period.
+REDUCERS = {'sum': np.add, 'min': np.minimum, 'max': np.maximum}
+
+class TimeSeries():
+    """
+    Columns of values indexed by sorted dates, one row per date. Looking
+      up a range of dates is a binary search, and the slice it returns
+      shares its arrays with the whole series.
+    """
+
+    def __init__(self, dates, columns):
+        """
+        Store dates as datetime64[D], and a dict mapping each column's name
+          to its values. Rows are sorted by date if they aren't already.
+        """
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        columns = {name: np.asarray(values)
+            for name, values in columns.items()}
+        for name, values in columns.items():
+            if len(values) != len(dates):
+                raise ValueError("Column {} has {} values for {} dates."
+                    .format(name, len(values), len(dates)))
+
+        if np.any(dates[1:] <= dates[:-1]):
+            order = np.argsort(dates, kind='stable')
+            dates = dates[order]
+            columns = {name: values[order]
+                for name, values in columns.items()}
+            if np.any(dates[1:] == dates[:-1]):
+                raise ValueError("Each date can only have one row.")
+
+        self.dates = dates
+        self.columns = columns
+        self.names = list(columns)
+
+    def __getitem__(self, name):
+        """Return the values of the column called name."""
+        return self.columns[name]
+
+    def __len__(self):
+        return len(self.dates)
+
+    def take(self, indexes):
+        """Return a series of just the rows at indexes, a slice or array."""
+        return TimeSeries(self.dates[indexes], {name: values[indexes]
+            for name, values in self.columns.items()})
+
+    def between(self, start=None, stop=None):
+        """
+        Return the rows from start up to but not including stop. Either
+          can be a date, a string like '2014-07-04', or None for no limit.
+        """
+        first = 0 if start is None else np.searchsorted(self.dates,
+            np.datetime64(start, 'D'))
+        last = len(self.dates) if stop is None else np.searchsorted(
+            self.dates, np.datetime64(stop, 'D'))
+        return self.take(slice(first, max(first, last)))
+
+    def period(self, period):
+        """
+        Return the rows in a year, month, or day given like '2014',
+          '2014-07', or '2014-07-04'.
+        """
+        period = np.datetime64(period)
+        return self.between(period, period + 1)
+
+    def across_years(self, start, stop):
+        """
+        Return (year, series) for the same stretch of every year, from
+          start up to stop, both given like '07-01'. A stop before start
+          runs into the next year.
+        """
+        if not len(self.dates):
+            return []
+        start_month, start_day = [int(part) for part in start.split('-')]
+        stop_month, stop_day = [int(part) for part in stop.split('-')]
+        wraps = (stop_month, stop_day) <= (start_month, start_day)
+
+        first_year = self.dates[0].astype('datetime64[Y]').astype(int) + 1970
+        last_year = self.dates[-1].astype('datetime64[Y]').astype(int) + 1970
+        stretches = []
+        for year in range(first_year - wraps, last_year + 1):
+            stretch = self.between(month_day(year, start_month, start_day),
+                month_day(year + wraps, stop_month, stop_day))
+            if len(stretch):
+                stretches.append((year, stretch))
+        return stretches
+
+    def period_starts(self, unit):
+        """
+        Return the first day of the week ('W'), month ('M'), or year ('Y')
+          each row falls in. Weeks start on Mondays.
+        """
+        if unit == 'W':
+            # Day 0, 1970-01-01, was a Thursday.
+            days = self.dates.astype(np.int64)
+            return ((days + 3) // 7 * 7 - 3).astype('datetime64[D]')
+        if unit not in ('M', 'Y'):
+            raise ValueError("Periods must be 'W', 'M', or 'Y'.")
+        return self.dates.astype('datetime64[' + unit + ']').astype(
+            'datetime64[D]')
+
+    def resample(self, unit, how='mean'):
+        """
+        Return a series with one row per week, month, or year, dated by
+          its first day. Each column is combined by how: 'mean', 'sum',
+          'min', 'max', or 'count'.
+        """
+        if how not in REDUCERS and how not in ('mean', 'count'):
+            raise ValueError("Can't combine values by {!r}.".format(how))
+        starts = self.period_starts(unit)
+
+        # Rows are in date order, so each period's rows are together.
+        firsts = np.flatnonzero(np.append(True, starts[1:] != starts[:-1]))
+        counts = np.diff(np.append(firsts, len(starts)))
+        columns = {}
+        for name, values in self.columns.items():
+            if how == 'count':
+                columns[name] = counts
+            elif not len(values):
+                columns[name] = values
+            elif how == 'mean':
+                columns[name] = np.add.reduceat(values, firsts) / counts
+            else:
+                columns[name] = REDUCERS[how].reduceat(values, firsts)
+        return TimeSeries(starts[firsts], columns)
+
+
+def month_day(year, month, day):
+    """Return a datetime64[D]; Feb 29 in other years becomes Mar 1."""
+    return (np.datetime64('{:04}-{:02}'.format(year, month), 'D') +
+        (day - 1))
+
+def join(series, how='inner'):
+    """
+    Line up several series by date, given as a dict of series by label,
+      such as a station name. Each column in the result is named for its
+      label and its own column. An 'inner' join keeps the dates every
+      series has; an 'outer' join keeps every date, with NaN where a
+      series has no row.
+    """
+    if how == 'inner':
+        dates = reduce(np.intersect1d, [one.dates for one in series.values()])
+    elif how == 'outer':
+        dates = reduce(np.union1d, [one.dates for one in series.values()])
+    else:
+        raise ValueError("Joins must be 'inner' or 'outer'.")
+
+    columns = {}
+    for label, one in series.items():
+        # Find each date in this series; a date past the end isn't there.
+        positions = np.searchsorted(one.dates, dates)
+        found = np.zeros(len(dates), dtype=bool)
+        inside = positions < len(one.dates)
+        found[inside] = one.dates[positions[inside]] == dates[inside]
+        for name, values in one.columns.items():
+            key = '{} {}'.format(label, name)
+            if found.all():
+                columns[key] = values[positions]
+            else:
+                columns[key] = np.full(len(dates), np.nan)
+                columns[key][found] = values[positions[found]]
+    return TimeSeries(dates, columns)
@@ -0,0 +1,254 @@
+import csv
+import os
+import re
+import warnings
+from itertools import compress
+
+import numpy as np
+
+from time_series import TimeSeries
+
+# Bump this when the cache layout changes, so old caches are rebuilt.
+CACHE_VERSION = 2
+
+# A date field, with or without leading zeros.
+DATE_PATTERN = re.compile(r'\s*\d+-\d+-\d+\s*$')
+
+# For str.translate(), to leave only the separators in a run of dates.
+REMOVE_DIGITS = str.maketrans('', '', '0123456789')
+
+class WeatherData():
+    """
+    One weather station's daily records, as typed columns. Each column
+      has a mask saying which days have a usable value.
+    """
+
+    def __init__(self, dates, columns, valid, bad_dates=()):
+        """
+        Store the dates as datetime64[D], and dicts mapping each column's
+          name to its values and to its validity mask. bad_dates holds the
+          date fields of rows that were skipped, because they weren't
+          dates.
+        """
+        self.dates = dates
+        self.columns = columns
+        self.valid = valid
+        self.bad_dates = list(bad_dates)
+        self.names = list(columns)
+
+    def __getitem__(self, name):
+        """Return the values of the column called name."""
+        return self.columns[name]
+
+    def __len__(self):
+        return len(self.dates)
+
+    def valid_rows(self, *names):
+        """
+        Return the dates, then the values of each named column, for the
+          days where every one of those columns has a value.
+        """
+        mask = ~self.missing(*names)
+        return [self.dates[mask]] + [self.columns[name][mask]
+            for name in names]
+
+    def series(self, *names):
+        """
+        Return a TimeSeries of the named columns, for the days where every
+          one of them has a value.
+        """
+        rows = self.valid_rows(*names)
+        return TimeSeries(rows[0], dict(zip(names, rows[1:])))
+
+    def missing(self, *names):
+        """Return a mask of the days missing a value in any named column."""
+        mask = np.zeros(len(self.dates), dtype=bool)
+        for name in names:
+            mask |= ~self.valid[name]
+        return mask
+
+
+def parse_dates(values):
+    """
+    Turn dates like 2014-1-1 or 2014-01-01 into datetime64[D], with
+      integer arithmetic on the whole column instead of strptime() per
+      date. Return the dates, and a mask of the values that were real
+      dates; the others come out as NaT.
+    """
+    dates = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[D]')
+    well_formed = np.ones(len(values), dtype=bool)
+    numbers = split_dates(values)
+    if numbers is None:
+        # Some values aren't dates at all; parse the ones that look right.
+        well_formed = np.array([DATE_PATTERN.match(value) is not None
+            for value in values], dtype=bool)
+        numbers = split_dates([value.strip()
+            for value in compress(values, well_formed)])
+    if numbers is None or not len(numbers):
+        return dates, np.zeros(len(values), dtype=bool)
+    year, month, day = numbers.reshape(-1, 3).T
+
+    # Count days from 1970-01-01 with March as the first month, so leap
+    #   days fall at the end of each year (Howard Hinnant's
+    #   days_from_civil).
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    shifted_month = month + np.where(month > 2, -3, 9)
+    day_of_year = (153 * shifted_month + 2) // 5 + day - 1
+    day_of_era = (year_of_era * 365 + year_of_era // 4 - year_of_era // 100 +
+        day_of_year)
+    parsed = (era * 146097 + day_of_era - 719468).astype('datetime64[D]')
+
+    # Dates like 2014-2-30 come out as some other day; leave them out.
+    months = parsed.astype('datetime64[M]')
+    exists = ((months.astype(np.int64) % 12 + 1 == numbers[1::3]) &
+        ((parsed - months).astype(np.int64) + 1 == numbers[2::3]))
+    dates[well_formed] = np.where(exists, parsed, np.datetime64('NaT'))
+    valid = well_formed.copy()
+    valid[well_formed] = exists
+    return dates, valid
+
+def split_dates(values):
+    """
+    Return the year, month, and day of every value, in one array of
+      numbers, or None unless every value is three numbers joined by
+      dashes.
+    """
+    if not len(values):
+        return np.zeros(0, dtype=np.int64)
+    # Without the digits, the text has to be two dashes for each date,
+    #   and the spaces between dates, and nothing else.
+    text = ' '.join(values)
+    if text.translate(REMOVE_DIGITS) != ' '.join(['--'] * len(values)):
+        return None
+    numbers = np.fromstring(text.replace('-', ' '), dtype=np.int64, sep=' ')
+    if len(numbers) != 3 * len(values):
+        return None
+    return numbers
+
+def parse_column(values):
+    """
+    Return a column's values as an array, and a mask of the ones that
+      are there. Whole numbers become ints, other numbers floats, and
+      anything else stays as strings.
+    """
+    # Empty fields are missing values; give the parser a NaN for each.
+    text = ','.join(values)
+    filled = (',' + text + ',').replace(',,', ',nan,').replace(',,', ',nan,')
+    with warnings.catch_warnings():
+        # NumPy only warns when it can't read a number, for now.
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            numbers = np.fromstring(filled[1:-1], dtype=float, sep=',')
+        except (ValueError, DeprecationWarning):
+            numbers = None
+
+    if numbers is None or len(numbers) != len(values):
+        strings = np.array(values)
+        return strings, strings != ''
+    valid = ~np.isnan(numbers)
+    if '.' not in text and 'e' not in text.lower():
+        return np.where(valid, numbers, 0).astype(np.int64), valid
+    return numbers, valid
+
+def split_columns(text, num_columns):
+    """
+    Split the rows of a CSV file into one list of fields per column, or
+      return None if the file needs a real CSV parser.
+    """
+    text = text.replace('\r\n', '\n').strip()
+    if not text or '"' in text or '\n\n' in text:
+        return None
+    fields = text.replace('\n', ',').split(',')
+    if len(fields) != (text.count('\n') + 1) * num_columns:
+        return None
+    return [fields[column::num_columns] for column in range(num_columns)]
+
+def read_csv(filename):
+    """Read a weather CSV into WeatherData, a column at a time."""
+    with open(filename, newline='') as f:
+        header_row = next(csv.reader(f))
+        text = f.read()
+
+    # Simple files are split in one go; files with quotes or ragged rows
+    #   go through the csv module.
+    names = [name.strip() for name in header_row]
+    columns = split_columns(text, len(names))
+    if columns is None:
+        rows = [row + [''] * (len(names) - len(row))
+            for row in csv.reader(text.splitlines()) if row]
+        columns = list(zip(*rows)) or [[] for name in names]
+
+    # The first column is the date; its name is the station's time zone.
+    #   Rows without a real date are left out, like the scripts always
+    #   skipped them.
+    dates, has_date = parse_dates(columns[0])
+    bad_dates = []
+    if not has_date.all():
+        bad_dates = list(compress(columns[0], ~has_date))
+        dates = dates[has_date]
+        columns = [list(compress(column, has_date)) for column in columns]
+    values, valid = {}, {}
+    for name, column in zip(names[1:], columns[1:]):
+        values[name], valid[name] = parse_column(column)
+    return WeatherData(dates, values, valid, bad_dates)
+
+def cache_path(filename):
+    """Return where the binary cache for a CSV file lives."""
+    return filename + '.npz'
+
+def read_cache(filename, stat):
+    """
+    Return WeatherData from the CSV's cache, or None if there's no cache
+      or it was made from a different version of the file.
+    """
+    try:
+        with np.load(cache_path(filename)) as cache:
+            if (int(cache['version']) != CACHE_VERSION or
+                    int(cache['mtime_ns']) != stat.st_mtime_ns or
+                    int(cache['size']) != stat.st_size):
+                return None
+            names = cache['names'].tolist()
+            return WeatherData(cache['dates'],
+                {name: cache['values_' + str(i)]
+                    for i, name in enumerate(names)},
+                {name: cache['valid_' + str(i)]
+                    for i, name in enumerate(names)},
+                cache['bad_dates'].tolist())
+    except (OSError, KeyError, ValueError):
+        return None
+
+def write_cache(filename, stat, data):
+    """Save data next to the CSV, keyed on the CSV's mtime and size."""
+    arrays = {'version': CACHE_VERSION, 'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size, 'names': np.array(data.names),
+        'dates': data.dates, 'bad_dates': np.array(data.bad_dates, dtype=str)}
+    for i, name in enumerate(data.names):
+        arrays['values_' + str(i)] = data.columns[name]
+        arrays['valid_' + str(i)] = data.valid[name]
+
+    # Write to a temporary file first, so a reader never sees half a cache.
+    temporary_path = '{}.{}.tmp'.format(cache_path(filename), os.getpid())
+    try:
+        with open(temporary_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(temporary_path, cache_path(filename))
+    except OSError:
+        # A read-only folder just means no cache.
+        pass
+
+def load_weather(filename, use_cache=True):
+    """
+    Return the weather in a CSV file as WeatherData. The parsed columns
+      are cached next to the file, and used until the file changes.
+    """
+    if not use_cache:
+        return read_csv(filename)
+
+    stat = os.stat(filename)
+    data = read_cache(filename, stat)
+    if data is None:
+        data = read_csv(filename)
+        write_cache(filename, stat, data)
+    return data
@@ -3,7 +3,7 @@ import json
 import pygal
 from pygal.style import LightColorizedStyle as LCS, RotateStyle as RS
 
-from country_codes import get_country_code
+from country_codes import get_country_code, lookup_stats
 
 # Load the data into a list.
 filename = 'population_data.json'
@@ -20,6 +20,9 @@ for pop_dict in pop_data:
         if code:
             cc_populations[code] = population
 
+# See how the country names were matched to codes.
+print(lookup_stats())
+
 # Group the countries into 3 population levels.
 cc_pops_1, cc_pops_2, cc_pops_3 = {}, {}, {}
 for cc, pop in cc_populations.items():